@@ -3,11 +3,16 @@
 Base classes and data structures for multi-language code analysis using tree-sitter.
 """
 
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Set, Tuple, Optional, Any
+from typing import Dict, Iterable, List, Set, Tuple, Optional, Any
 from enum import Enum
 
+from tree_sitter import Parser
+
 
 class ScopeType(Enum):
     """Types of code scopes across different languages."""
@@ -47,10 +52,19 @@ class BaseLanguageAnalyzer(ABC):
     to provide language-specific code analysis using tree-sitter.
     """
 
+    # Bound on per-analyzer memo entries; caches are cleared wholesale once reached
+    _CACHE_LIMIT = 32
+
     def __init__(self, language: str):
         self.language = language
         self._parser = None
         self._tree_sitter_language = None
+        self._parser_local = threading.local()
+        self._init_lock = threading.Lock()
+        # src-keyed memos: id(src) -> (src, value). The src reference is kept
+        # so a recycled id() of a garbage-collected string cannot alias a stale entry.
+        self._tree_cache: Dict[int, Tuple[str, Any]] = {}
+        self._line_count_cache: Dict[int, Tuple[str, int]] = {}
 
     @abstractmethod
     def _init_parser(self):
@@ -59,14 +73,49 @@ class BaseLanguageAnalyzer(ABC):
 
     @property
     def parser(self):
-        """Lazy initialization of parser."""
-        if self._parser is None:
-            self._init_parser()
-        return self._parser
+        """
+        Lazy per-thread parser.
+
+        Parser objects are not safe to share between threads, so each thread
+        gets its own instance built from the shared Language. Tree-sitter
+        releases the GIL while parsing, which makes analyze_many scale.
+        """
+        parser = getattr(self._parser_local, "parser", None)
+        if parser is None:
+            if self._tree_sitter_language is None:
+                with self._init_lock:
+                    if self._tree_sitter_language is None:
+                        self._init_parser()
+            parser = Parser(self._tree_sitter_language)
+            self._parser_local.parser = parser
+        return parser
 
     def parse(self, src: str):
-        """Parse source code and return tree-sitter tree."""
-        return self.parser.parse(bytes(src, "utf-8"))
+        """Parse source code and return tree-sitter tree (memoized per src object)."""
+        cached = self._tree_cache.get(id(src))
+        if cached is not None and cached[0] is src:
+            return cached[1]
+        tree = self.parser.parse(bytes(src, "utf-8"))
+        if len(self._tree_cache) >= self._CACHE_LIMIT:
+            self._tree_cache.clear()
+        self._tree_cache[id(src)] = (src, tree)
+        return tree
+
+    def _line_count(self, src: str) -> int:
+        """
+        Count lines in src without materializing the line list.
+
+        Equivalent to len(src.splitlines()) for sources without exotic line
+        separators, but avoids allocating one string per line.
+        """
+        cached = self._line_count_cache.get(id(src))
+        if cached is not None and cached[0] is src:
+            return cached[1]
+        n = src.count("\n") + (0 if not src or src.endswith("\n") else 1)
+        if len(self._line_count_cache) >= self._CACHE_LIMIT:
+            self._line_count_cache.clear()
+        self._line_count_cache[id(src)] = (src, n)
+        return n
 
     @abstractmethod
     def get_executable_lines(self, src: str, modified_lines: Set[int]) -> Tuple[Set[int], Set[int]]:
@@ -116,6 +165,9 @@ class BaseLanguageAnalyzer(ABC):
         """
         Get tree-sitter nodes indexed by line number.
 
+        Lazy: no longer invoked by analyze(). Only call this when the full
+        per-line map is actually needed; filtering uses on-demand tree lookups.
+
         Args:
             src: Source code content
 
@@ -124,12 +176,29 @@ class BaseLanguageAnalyzer(ABC):
         """
         pass
 
+    def _node_at_line(self, root, nodes_by_lineno: Dict[int, Any], ln: int):
+        """
+        Resolve the tree-sitter node for a line.
+
+        Prefers an on-demand descendant lookup on the tree root (pays only for
+        the lines actually requested); falls back to a precomputed
+        nodes_by_lineno map when no root is available. Returns None for lines
+        not covered by any node narrower than the whole file.
+        """
+        if root is not None:
+            node = root.descendant_for_point_range((ln - 1, 0), (ln - 1, 0))
+            if node is None or node == root:
+                return None
+            return node
+        return nodes_by_lineno.get(ln)
+
     @abstractmethod
     def filtered_global_modified(
         self,
         line2scope: Dict[int, Tuple[str, str]],
         nodes_by_lineno: Dict[int, Any],
-        modified_lines: Set[int]
+        modified_lines: Set[int],
+        src: Optional[str] = None
     ) -> Set[int]:
         """
         Filter out insignificant global-level statements.
@@ -137,7 +206,10 @@ class BaseLanguageAnalyzer(ABC):
         Args:
             line2scope: Mapping from line to scope info
             nodes_by_lineno: Mapping from line to tree-sitter nodes
+                (only consulted when src is not given)
             modified_lines: Set of modified line numbers
+            src: Source code content; when given, nodes are looked up on
+                demand from the (memoized) parse tree instead of the full map
 
         Returns:
             Filtered set of modified lines with semantic significance
@@ -158,13 +230,40 @@ class BaseLanguageAnalyzer(ABC):
         executable_lines, corrected_modified = self.get_executable_lines(src, modified_lines.copy())
         line_to_scope = self.build_line_scope(src)
         defs, uses = self.build_def_use(src)
-        nodes_by_lineno = self.get_nodes_by_lineno(src)
 
+        # nodes_by_lineno is left empty: filtered_global_modified resolves nodes
+        # on demand from the parse tree, so the full per-line map is not needed.
         return AnalysisResult(
             executable_lines=executable_lines,
             modified_lines=corrected_modified,
             line_to_scope=line_to_scope,
             defs=defs,
-            uses=uses,
-            nodes_by_lineno=nodes_by_lineno
+            uses=uses
         )
+
+    def analyze_many(
+        self,
+        items: Iterable[Tuple[str, Set[int]]],
+        max_workers: Optional[int] = None
+    ) -> List[AnalysisResult]:
+        """
+        Analyze several (src, modified_lines) pairs concurrently.
+
+        Parsing happens in C with the GIL released, so a thread pool gives
+        real parallelism on the parse-heavy phase of bulk corpus analysis.
+        Each worker thread uses its own parser (see the parser property).
+
+        Args:
+            items: Iterable of (src, modified_lines) pairs
+            max_workers: Thread count; defaults to min(len(items), cpu count)
+
+        Returns:
+            List of AnalysisResult in input order
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [self.analyze(src, modified) for src, modified in items]
+
+        workers = max_workers or min(len(items), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda item: self.analyze(item[0], item[1]), items))
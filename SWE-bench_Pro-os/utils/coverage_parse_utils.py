@@ -34,24 +34,71 @@ Usage:
 import json
 import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 
-
-@dataclass
+# orjson parses the multi-MB coverage JSON files several times faster than
+# stdlib json; fall back to stdlib when it is not installed. Serialization
+# stays on stdlib json (the dump paths are not hot).
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# The coverprofile pattern has no backreferences, so it also runs on re2's
+# linear-time DFA engine when the binding is installed; stdlib re is the
+# fallback and stays the engine everywhere else in this module.
+try:
+    import re2 as _go_re
+except ImportError:
+    _go_re = re
+
+# Go coverprofile line: file:startLine.startCol,endLine.endCol numStatements count
+# Compiled once at module scope; columns and statement count are never used,
+# so they are left ungrouped. Multiline bytes pattern so the whole file can be
+# scanned with one finditer pass instead of per-line Python dispatch; the
+# "mode:" header simply does not match. The path is matched greedily so only
+# the final ":line.col,line.col" suffix is structural (paths may contain
+# colons), and the optional \r keeps CRLF profiles parsing.
+_GO_COV_RE = _go_re.compile(rb'^(.+):(\d+)\.\d+,(\d+)\.\d+[ \t]+\d+[ \t]+(\d+)[ \t]*\r?$', _go_re.MULTILINE)
+
+# Line-start offsets per source file, keyed on (path, mtime_ns) so an edited
+# file is re-scanned. Shared across parse calls because batch runs resolve
+# the same sources repeatedly; bounded and cleared wholesale once full.
+_LINE_OFFSET_CACHE_LIMIT = 512
+_line_offset_cache: Dict[Tuple[str, int], List[int]] = {}
+
+# Shared read-only stand-in for "no coverage data"; avoids allocating an
+# empty set per file in the scoring loop
+_EMPTY_SET: frozenset = frozenset()
+
+
+@dataclass(slots=True)
 class FileCoverage:
     """Coverage information for a single file."""
     executed_lines: Set[int] = field(default_factory=set)
     missing_lines: Set[int] = field(default_factory=set)
+    # Sorted snapshots built lazily by to_dict; parsers finish mutating the
+    # line sets before anything serializes, so first-call caching is safe
+    _sorted_executed: Optional[List[int]] = field(default=None, init=False, repr=False, compare=False)
+    _sorted_missing: Optional[List[int]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, List[int]]:
+        if self._sorted_executed is None:
+            self._sorted_executed = sorted(self.executed_lines)
+            self._sorted_missing = sorted(self.missing_lines)
         return {
-            "executed_lines": sorted(self.executed_lines),
-            "missing_lines": sorted(self.missing_lines)
+            "executed_lines": self._sorted_executed,
+            "missing_lines": self._sorted_missing
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageResult:
     """Unified coverage result."""
     language: str
@@ -69,30 +116,35 @@ def detect_language_from_instance(instance_dir: str) -> Optional[str]:
     workspace_dir = os.path.join(instance_dir, "workspace")
     coverage_dir = os.path.join(workspace_dir, "coverage")
 
-    if not os.path.exists(coverage_dir):
+    # One scandir lists every artifact at once instead of stat-ing each
+    # candidate name separately; a missing coverage dir raises here
+    try:
+        with os.scandir(coverage_dir) as it:
+            names = {entry.name for entry in it}
+    except OSError:
         return None
 
     # Check for Python coverage
-    if os.path.exists(os.path.join(coverage_dir, "coverage.json")):
+    if "coverage.json" in names:
         return "python"
 
     # Check for Go coverage
-    if os.path.exists(os.path.join(coverage_dir, "coverage.out")):
+    if "coverage.out" in names:
         return "go"
 
     # Check for Istanbul (JS) coverage
-    if os.path.exists(os.path.join(coverage_dir, "coverage-final.json")):
+    if "coverage-final.json" in names:
         return "javascript"
 
     # Check for V8 coverage (TS)
-    v8_dir = os.path.join(coverage_dir, "v8-coverage")
-    if os.path.exists(v8_dir) and os.listdir(v8_dir):
+    if "v8-coverage" in names and os.listdir(os.path.join(coverage_dir, "v8-coverage")):
         return "typescript"
 
     return None
 
 
-def parse_python_coverage(coverage_path: str, repo_prefix: str = "/app") -> CoverageResult:
+def parse_python_coverage(coverage_path: str, repo_prefix: str = "/app",
+                          file_filter: Optional[Set[str]] = None) -> CoverageResult:
     """
     Parse Python coverage.py JSON format.
 
@@ -108,8 +160,8 @@ def parse_python_coverage(coverage_path: str, repo_prefix: str = "/app") -> Cove
     """
     result = CoverageResult(language="python")
 
-    with open(coverage_path, 'r') as f:
-        data = json.load(f)
+    with open(coverage_path, 'rb') as f:
+        data = _loads(f.read())
 
     files_data = data.get("files", {})
 
@@ -119,6 +171,9 @@ def parse_python_coverage(coverage_path: str, repo_prefix: str = "/app") -> Cove
         if repo_prefix and file_path.startswith(repo_prefix):
             normalized_path = file_path[len(repo_prefix):].lstrip("/")
 
+        if file_filter is not None and normalized_path not in file_filter:
+            continue
+
         cov = FileCoverage()
         cov.executed_lines = set(file_info.get("executed_lines", []))
         cov.missing_lines = set(file_info.get("missing_lines", []))
@@ -128,7 +183,8 @@ def parse_python_coverage(coverage_path: str, repo_prefix: str = "/app") -> Cove
     return result
 
 
-def parse_go_coverage(coverage_path: str, module_prefix: str = "") -> CoverageResult:
+def parse_go_coverage(coverage_path: str, module_prefix: str = "",
+                      file_filter: Optional[Set[str]] = None) -> CoverageResult:
     """
     Parse Go coverprofile format.
 
@@ -144,63 +200,59 @@ def parse_go_coverage(coverage_path: str, module_prefix: str = "") -> CoverageRe
     """
     result = CoverageResult(language="go")
 
-    # Track line coverage per file
-    file_coverage: Dict[str, Dict[int, bool]] = {}  # file -> line -> executed
-
-    with open(coverage_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("mode:"):
-                continue
-
-            # Parse: file:startLine.startCol,endLine.endCol numStatements count
-            match = re.match(r'^(.+):(\d+)\.(\d+),(\d+)\.(\d+)\s+(\d+)\s+(\d+)$', line)
-            if not match:
-                continue
+    # Track line coverage per file as two sets: every line seen in a range,
+    # and lines seen in a range with count > 0. Missing lines fall out as the
+    # difference, with no per-line dict lookups or branches.
+    seen: Dict[str, Set[int]] = {}
+    executed: Dict[str, Set[int]] = {}
+
+    # Bulk-read the profile and scan it with one multiline finditer pass:
+    # the regex engine walks the buffer in C, so there is no per-line
+    # strip/startswith/match dispatch in Python.
+    with open(coverage_path, 'rb') as f:
+        text = f.read()
+
+    for match in _GO_COV_RE.finditer(text):
+        file_path = match.group(1).decode("utf-8")
+        start_line = int(match.group(2))
+        end_line = int(match.group(3))
+        count = int(match.group(4))
+
+        # Normalize path - extract relative path from module
+        if module_prefix and file_path.startswith(module_prefix):
+            normalized_path = file_path[len(module_prefix):].lstrip("/")
+        else:
+            # Try to extract from common patterns like github.com/org/repo/...
+            parts = file_path.split("/")
+            if len(parts) > 3 and parts[0] in ("github.com", "gitlab.com", "bitbucket.org"):
+                # Remove github.com/org/repo prefix
+                normalized_path = "/".join(parts[3:])
+            else:
+                normalized_path = file_path
 
-            file_path = match.group(1)
-            start_line = int(match.group(2))
-            end_line = int(match.group(4))
-            count = int(match.group(7))
+        if file_filter is not None and normalized_path not in file_filter:
+            continue
 
-            # Normalize path - extract relative path from module
-            if module_prefix and file_path.startswith(module_prefix):
-                normalized_path = file_path[len(module_prefix):].lstrip("/")
-            else:
-                # Try to extract from common patterns like github.com/org/repo/...
-                parts = file_path.split("/")
-                if len(parts) > 3 and parts[0] in ("github.com", "gitlab.com", "bitbucket.org"):
-                    # Remove github.com/org/repo prefix
-                    normalized_path = "/".join(parts[3:])
-                else:
-                    normalized_path = file_path
-
-            if normalized_path not in file_coverage:
-                file_coverage[normalized_path] = {}
-
-            # Mark all lines in the range
-            for line_num in range(start_line, end_line + 1):
-                # If count > 0, it's executed; otherwise it's not
-                if line_num not in file_coverage[normalized_path]:
-                    file_coverage[normalized_path][line_num] = count > 0
-                elif count > 0:
-                    # If any range covering this line has count > 0, it's executed
-                    file_coverage[normalized_path][line_num] = True
+        # Mark all lines in the range; a line is executed if any range
+        # covering it has count > 0
+        line_range = range(start_line, end_line + 1)
+        seen.setdefault(normalized_path, set()).update(line_range)
+        if count > 0:
+            executed.setdefault(normalized_path, set()).update(line_range)
 
     # Convert to FileCoverage objects
-    for file_path, lines in file_coverage.items():
-        cov = FileCoverage()
-        for line_num, executed in lines.items():
-            if executed:
-                cov.executed_lines.add(line_num)
-            else:
-                cov.missing_lines.add(line_num)
-        result.files[file_path] = cov
+    for file_path, seen_lines in seen.items():
+        executed_lines = executed.get(file_path, set())
+        result.files[file_path] = FileCoverage(
+            executed_lines=executed_lines,
+            missing_lines=seen_lines - executed_lines
+        )
 
     return result
 
 
-def parse_istanbul_coverage(coverage_path: str, repo_prefix: str = "/app") -> CoverageResult:
+def parse_istanbul_coverage(coverage_path: str, repo_prefix: str = "/app",
+                            file_filter: Optional[Set[str]] = None) -> CoverageResult:
     """
     Parse Istanbul/nyc coverage-final.json format.
 
@@ -222,8 +274,8 @@ def parse_istanbul_coverage(coverage_path: str, repo_prefix: str = "/app") -> Co
     """
     result = CoverageResult(language="javascript")
 
-    with open(coverage_path, 'r') as f:
-        data = json.load(f)
+    with open(coverage_path, 'rb') as f:
+        data = _loads(f.read())
 
     for file_path, file_info in data.items():
         # Normalize path
@@ -231,7 +283,14 @@ def parse_istanbul_coverage(coverage_path: str, repo_prefix: str = "/app") -> Co
         if repo_prefix and file_path.startswith(repo_prefix):
             normalized_path = file_path[len(repo_prefix):].lstrip("/")
 
-        cov = FileCoverage()
+        if file_filter is not None and normalized_path not in file_filter:
+            continue
+
+        # Track every line plus the executed ones; missing lines fall out as
+        # the difference, so a line overlapping both an executed and a missed
+        # statement is never added to two sets and then subtracted back out
+        all_lines: Set[int] = set()
+        executed: Set[int] = set()
 
         # Get all lines from statementMap
         statement_map = file_info.get("statementMap", {})
@@ -249,21 +308,91 @@ def parse_istanbul_coverage(coverage_path: str, repo_prefix: str = "/app") -> Co
 
             count = statement_counts.get(stmt_id, 0)
 
-            for line_num in range(start_line, end_line + 1):
-                if count > 0:
-                    cov.executed_lines.add(line_num)
-                else:
-                    cov.missing_lines.add(line_num)
-
-        # Remove executed lines from missing (in case of overlap)
-        cov.missing_lines -= cov.executed_lines
+            # set.update walks the range in C
+            line_range = range(start_line, end_line + 1)
+            all_lines.update(line_range)
+            if count > 0:
+                executed.update(line_range)
 
-        result.files[normalized_path] = cov
+        result.files[normalized_path] = FileCoverage(
+            executed_lines=executed,
+            missing_lines=all_lines - executed
+        )
 
     return result
 
 
-def parse_v8_coverage(coverage_dir: str, repo_prefix: str = "/app") -> CoverageResult:
+def _load_v8_shards(coverage_dir: str) -> List[Any]:
+    """
+    Load every V8 JSON shard in a directory; unreadable shards are skipped.
+
+    Shard reads are I/O bound and orjson releases the GIL while parsing, so a
+    small thread pool overlaps read+parse across shards. Workers are capped at
+    8 to bound peak memory, which scales with workers x shard size.
+    """
+    with os.scandir(coverage_dir) as dir_iter:
+        shard_paths = [entry.path for entry in dir_iter if entry.name.endswith(".json")]
+
+    def _load(path: str):
+        try:
+            with open(path, 'rb') as f:
+                return _loads(f.read())
+        except (ValueError, IOError):
+            return None
+
+    if len(shard_paths) <= 1:
+        datas = [_load(path) for path in shard_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(shard_paths))) as pool:
+            datas = list(pool.map(_load, shard_paths))
+
+    return [data for data in datas if data is not None]
+
+
+def _flatten_v8_ranges(ranges: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+    """
+    Flatten nested V8 ranges into disjoint (start, end, count) segments.
+
+    V8 emits an outer function range subdivided by inner sub-ranges whose
+    counts override the outer one. Sorting by (start, -end) places every
+    enclosing range before the ranges nested inside it; a stack sweep then
+    emits non-overlapping segments where the innermost count wins. Each byte
+    is expanded into line sets exactly once, and an uncovered inner range is
+    no longer masked by its covered outer function range.
+    """
+    if not ranges:
+        return []
+
+    segments: List[Tuple[int, int, int]] = []
+    stack: List[Tuple[int, int, int]] = []  # open enclosing ranges, outermost first
+    ordered = sorted(ranges, key=lambda r: (r[0], -r[1]))
+    cursor = ordered[0][0]
+
+    for start, end, count in ordered:
+        # Close ranges that end at or before this one starts, emitting the
+        # still-unwritten tail of each with its own (innermost-first) count
+        while stack and stack[-1][1] <= start:
+            _, top_end, top_count = stack.pop()
+            if cursor < top_end:
+                segments.append((cursor, top_end, top_count))
+                cursor = top_end
+        # Gap between two siblings belongs to the enclosing range
+        if stack and cursor < start:
+            segments.append((cursor, start, stack[-1][2]))
+        cursor = max(cursor, start)
+        stack.append((start, end, count))
+
+    while stack:
+        _, top_end, top_count = stack.pop()
+        if cursor < top_end:
+            segments.append((cursor, top_end, top_count))
+            cursor = top_end
+
+    return segments
+
+
+def parse_v8_coverage(coverage_dir: str, repo_prefix: str = "/app",
+                      file_filter: Optional[Set[str]] = None) -> CoverageResult:
     """
     Parse V8 coverage format (multiple JSON files in v8-coverage directory).
 
@@ -295,18 +424,8 @@ def parse_v8_coverage(coverage_dir: str, repo_prefix: str = "/app") -> CoverageR
     # Collect all coverage data
     file_offsets: Dict[str, List[Tuple[int, int, int]]] = {}  # path -> [(start, end, count)]
 
-    # Read all coverage files
-    for filename in os.listdir(coverage_dir):
-        if not filename.endswith(".json"):
-            continue
-
-        filepath = os.path.join(coverage_dir, filename)
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            continue
-
+    # Read all coverage files (threaded across shards)
+    for data in _load_v8_shards(coverage_dir):
         for script in data.get("result", []):
             url = script.get("url", "")
 
@@ -327,6 +446,9 @@ def parse_v8_coverage(coverage_dir: str, repo_prefix: str = "/app") -> CoverageR
             if repo_prefix and file_path.startswith(repo_prefix):
                 normalized_path = file_path[len(repo_prefix):].lstrip("/")
 
+            if file_filter is not None and normalized_path not in file_filter:
+                continue
+
             if normalized_path not in file_offsets:
                 file_offsets[normalized_path] = []
 
@@ -341,32 +463,41 @@ def parse_v8_coverage(coverage_dir: str, repo_prefix: str = "/app") -> CoverageR
     # Note: For accurate conversion, we'd need the source files
     # This simplified version estimates lines based on average line length
     for file_path, offsets in file_offsets.items():
-        cov = FileCoverage()
-
         # Estimate line numbers from offsets
         # Assume average line is ~50 characters
         AVG_LINE_LEN = 50
 
-        for start, end, count in offsets:
+        # Do the arithmetic pass first, deduplicating the resulting line spans
+        # - V8 re-emits the same function ranges across shards, so each
+        # distinct span is expanded into the sets only once. Missing lines
+        # fall out as all - executed, with no add-then-subtract round trip.
+        all_spans = set()
+        exec_spans = set()
+        for start, end, count in _flatten_v8_ranges(offsets):
             start_line = max(1, start // AVG_LINE_LEN + 1)
             end_line = max(start_line, end // AVG_LINE_LEN + 1)
-
-            for line_num in range(start_line, end_line + 1):
-                if count > 0:
-                    cov.executed_lines.add(line_num)
-                else:
-                    cov.missing_lines.add(line_num)
-
-        # Remove executed from missing
-        cov.missing_lines -= cov.executed_lines
-
-        if cov.executed_lines or cov.missing_lines:
-            result.files[file_path] = cov
+            all_spans.add((start_line, end_line))
+            if count > 0:
+                exec_spans.add((start_line, end_line))
+
+        all_lines: Set[int] = set()
+        executed: Set[int] = set()
+        for start_line, end_line in all_spans:
+            all_lines.update(range(start_line, end_line + 1))
+        for start_line, end_line in exec_spans:
+            executed.update(range(start_line, end_line + 1))
+
+        if all_lines:
+            result.files[file_path] = FileCoverage(
+                executed_lines=executed,
+                missing_lines=all_lines - executed
+            )
 
     return result
 
 
-def parse_v8_coverage_with_source(coverage_dir: str, source_dir: str, repo_prefix: str = "/app") -> CoverageResult:
+def parse_v8_coverage_with_source(coverage_dir: str, source_dir: str, repo_prefix: str = "/app",
+                                  file_filter: Optional[Set[str]] = None) -> CoverageResult:
     """
     Parse V8 coverage with actual source files for accurate line mapping.
 
@@ -377,43 +508,40 @@ def parse_v8_coverage_with_source(coverage_dir: str, source_dir: str, repo_prefi
     """
     result = CoverageResult(language="typescript")
 
-    # Build a cache of source file line offsets
     def get_line_offsets(filepath: str) -> List[int]:
-        """Get byte offset of each line start."""
+        """Get byte offset of each line start (memoized per file and mtime)."""
+        try:
+            key = (filepath, os.stat(filepath).st_mtime_ns)
+        except OSError:
+            return [0]
+
+        offsets = _line_offset_cache.get(key)
+        if offsets is not None:
+            return offsets
+
         offsets = [0]
         try:
             with open(filepath, 'rb') as f:
                 content = f.read()
-            offset = 0
-            for char in content:
-                offset += 1
-                if char == ord('\n'):
-                    offsets.append(offset)
+            # Locate newlines with a C-level scan instead of iterating the
+            # buffer byte by byte in Python; each match end is a line start.
+            offsets.extend(m.end() for m in re.finditer(b'\n', content))
         except (IOError, OSError):
             pass
+
+        if len(_line_offset_cache) >= _LINE_OFFSET_CACHE_LIMIT:
+            _line_offset_cache.clear()
+        _line_offset_cache[key] = offsets
         return offsets
 
     def offset_to_line(offsets: List[int], byte_offset: int) -> int:
-        """Convert byte offset to line number."""
-        for i, line_offset in enumerate(offsets):
-            if line_offset > byte_offset:
-                return max(1, i)
-        return max(1, len(offsets))
+        """Convert byte offset to line number (binary search over sorted offsets)."""
+        return max(1, bisect_right(offsets, byte_offset))
 
     # Collect all coverage data
     file_ranges: Dict[str, List[Tuple[int, int, int]]] = {}
 
-    for filename in os.listdir(coverage_dir):
-        if not filename.endswith(".json"):
-            continue
-
-        filepath = os.path.join(coverage_dir, filename)
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            continue
-
+    for data in _load_v8_shards(coverage_dir):
         for script in data.get("result", []):
             url = script.get("url", "")
 
@@ -431,6 +559,9 @@ def parse_v8_coverage_with_source(coverage_dir: str, source_dir: str, repo_prefi
             if repo_prefix and file_path.startswith(repo_prefix):
                 normalized_path = file_path[len(repo_prefix):].lstrip("/")
 
+            if file_filter is not None and normalized_path not in file_filter:
+                continue
+
             if normalized_path not in file_ranges:
                 file_ranges[normalized_path] = []
 
@@ -443,45 +574,48 @@ def parse_v8_coverage_with_source(coverage_dir: str, source_dir: str, repo_prefi
 
     # Convert ranges to lines
     for file_path, ranges in file_ranges.items():
-        cov = FileCoverage()
+        # Missing lines fall out as all - executed at the end, instead of
+        # filling two sets and subtracting the overlap back out
+        all_lines: Set[int] = set()
+        executed: Set[int] = set()
 
         # Try to find the source file
         source_path = os.path.join(source_dir, file_path)
         if os.path.exists(source_path):
             offsets = get_line_offsets(source_path)
 
-            for start, end, count in ranges:
+            for start, end, count in _flatten_v8_ranges(ranges):
                 start_line = offset_to_line(offsets, start)
                 end_line = offset_to_line(offsets, end)
 
-                for line_num in range(start_line, end_line + 1):
-                    if count > 0:
-                        cov.executed_lines.add(line_num)
-                    else:
-                        cov.missing_lines.add(line_num)
+                line_range = range(start_line, end_line + 1)
+                all_lines.update(line_range)
+                if count > 0:
+                    executed.update(line_range)
         else:
             # Fallback to estimation
             AVG_LINE_LEN = 50
-            for start, end, count in ranges:
+            for start, end, count in _flatten_v8_ranges(ranges):
                 start_line = max(1, start // AVG_LINE_LEN + 1)
                 end_line = max(start_line, end // AVG_LINE_LEN + 1)
 
-                for line_num in range(start_line, end_line + 1):
-                    if count > 0:
-                        cov.executed_lines.add(line_num)
-                    else:
-                        cov.missing_lines.add(line_num)
-
-        cov.missing_lines -= cov.executed_lines
+                line_range = range(start_line, end_line + 1)
+                all_lines.update(line_range)
+                if count > 0:
+                    executed.update(line_range)
 
-        if cov.executed_lines or cov.missing_lines:
-            result.files[file_path] = cov
+        if all_lines:
+            result.files[file_path] = FileCoverage(
+                executed_lines=executed,
+                missing_lines=all_lines - executed
+            )
 
     return result
 
 
 def parse_coverage(instance_dir: str, language: Optional[str] = None,
-                   source_dir: Optional[str] = None) -> Optional[CoverageResult]:
+                   source_dir: Optional[str] = None,
+                   file_filter: Optional[Set[str]] = None) -> Optional[CoverageResult]:
     """
     Parse coverage from an instance directory.
 
@@ -489,6 +623,8 @@ def parse_coverage(instance_dir: str, language: Optional[str] = None,
         instance_dir: Path to instance directory (containing workspace/coverage)
         language: Override language detection (python, go, javascript, typescript)
         source_dir: Path to source directory for accurate line mapping (optional)
+        file_filter: When given, only these normalized paths are parsed into
+            the result; everything else is skipped before set construction
 
     Returns:
         CoverageResult or None if parsing fails
@@ -506,34 +642,61 @@ def parse_coverage(instance_dir: str, language: Optional[str] = None,
     if language is None:
         return None
 
-    try:
-        if language == "python":
-            coverage_path = os.path.join(coverage_dir, "coverage.json")
-            return parse_python_coverage(coverage_path)
-
-        elif language == "go":
-            coverage_path = os.path.join(coverage_dir, "coverage.out")
-            return parse_go_coverage(coverage_path)
-
-        elif language == "javascript":
-            coverage_path = os.path.join(coverage_dir, "coverage-final.json")
-            return parse_istanbul_coverage(coverage_path)
-
-        elif language == "typescript":
-            v8_dir = os.path.join(coverage_dir, "v8-coverage")
-            if source_dir:
-                return parse_v8_coverage_with_source(v8_dir, source_dir)
-            else:
-                return parse_v8_coverage(v8_dir)
+    coverage_artifacts = {
+        "python": "coverage.json",
+        "go": "coverage.out",
+        "javascript": "coverage-final.json",
+        "typescript": "v8-coverage",
+    }
+    artifact = coverage_artifacts.get(language)
+    if artifact is None:
+        return None
 
-        else:
-            return None
+    try:
+        coverage_path = os.path.join(coverage_dir, artifact)
+        # Key the cache on the artifact's mtime so a rerun that rewrites the
+        # coverage file misses instead of serving a stale result
+        mtime_ns = os.stat(coverage_path).st_mtime_ns
+        return _parse_coverage_cached(
+            language, coverage_path, source_dir, mtime_ns,
+            frozenset(file_filter) if file_filter is not None else None)
 
     except Exception as e:
         print(f"Error parsing coverage for {instance_dir}: {e}")
         return None
 
 
+@lru_cache(maxsize=1024)
+def _parse_coverage_cached(language: str, coverage_path: str,
+                           source_dir: Optional[str], mtime_ns: int,
+                           file_filter: Optional[frozenset] = None) -> Optional[CoverageResult]:
+    """
+    Parse one coverage artifact, memoized on (language, path, source_dir, mtime).
+
+    Repeated compute_coverage calls against the same instance (e.g. scoring
+    several required-lines variants) reuse the parsed result instead of
+    redoing the JSON/regex work. Batch runners that want a flush can call
+    _parse_coverage_cached.cache_clear().
+    """
+    if language == "python":
+        return parse_python_coverage(coverage_path, file_filter=file_filter)
+
+    elif language == "go":
+        return parse_go_coverage(coverage_path, file_filter=file_filter)
+
+    elif language == "javascript":
+        return parse_istanbul_coverage(coverage_path, file_filter=file_filter)
+
+    elif language == "typescript":
+        if source_dir:
+            return parse_v8_coverage_with_source(coverage_path, source_dir,
+                                                 file_filter=file_filter)
+        else:
+            return parse_v8_coverage(coverage_path, file_filter=file_filter)
+
+    return None
+
+
 def compare_coverage(coverage: CoverageResult,
                      required_lines: Dict[str, List[int]]) -> Dict[str, Any]:
     """
@@ -608,17 +771,33 @@ def parse_all_instances(instances_dir: str) -> Dict[str, CoverageResult]:
     """
     results = {}
 
-    for entry in os.listdir(instances_dir):
-        if not entry.startswith("instance_"):
-            continue
-
-        instance_dir = os.path.join(instances_dir, entry)
-        if not os.path.isdir(instance_dir):
-            continue
+    # scandir's DirEntry caches the dir/file type from the listing itself,
+    # so no extra stat per entry
+    with os.scandir(instances_dir) as dir_iter:
+        candidates = [
+            entry.name for entry in dir_iter
+            if entry.name.startswith("instance_") and entry.is_dir()
+        ]
 
-        coverage = parse_coverage(instance_dir)
-        if coverage:
-            results[entry] = coverage
+    # Instances are independent and parsing is CPU-bound (JSON, regex), so a
+    # process pool scales with cores. Small batches stay serial to avoid
+    # paying pool startup for a handful of parses.
+    if len(candidates) < 4:
+        for entry in candidates:
+            coverage = parse_coverage(os.path.join(instances_dir, entry))
+            if coverage:
+                results[entry] = coverage
+        return results
+
+    with ProcessPoolExecutor() as pool:
+        futures = {
+            entry: pool.submit(parse_coverage, os.path.join(instances_dir, entry))
+            for entry in candidates
+        }
+        for entry, future in futures.items():
+            coverage = future.result()
+            if coverage:
+                results[entry] = coverage
 
     return results
 
@@ -657,8 +836,16 @@ def compute_coverage(
     if len(modified_related_lines) == 0:
         return 1.0, {}
 
-    # Parse coverage from instance
-    coverage_result = parse_coverage(instance_dir)
+    # Parse coverage from instance; only the files being scored are needed,
+    # so push the filter down and skip set construction for everything else
+    coverage_result = parse_coverage(
+        instance_dir, file_filter=set(modified_related_lines.keys()))
+
+    if coverage_result is not None and len(coverage_result.files) == 0:
+        # No scored file appears in the coverage data. Re-parse unfiltered
+        # (memoized) so "artifact is empty" still reports 404 while "coverage
+        # exists but misses every scored file" scores normally, as before.
+        coverage_result = parse_coverage(instance_dir)
 
     if coverage_result is None or len(coverage_result.files) == 0:
         return 404, {}
@@ -671,9 +858,10 @@ def compute_coverage(
         if len(lines) == 0:
             continue
 
-        # Get executed lines from coverage
+        # Get executed lines from coverage; executed_lines is already a set
+        # and is only read from here, so no defensive copy is needed
         file_cov = coverage_result.files.get(file_name)
-        trace_exe_lines = set(file_cov.executed_lines) if file_cov else set()
+        trace_exe_lines = file_cov.executed_lines if file_cov else _EMPTY_SET
 
         un_hit_lines = lines - trace_exe_lines
 
@@ -683,13 +871,32 @@ def compute_coverage(
 
         total_avg += (1 - len(un_hit_lines) / len(lines))
 
-        # Extract content for unhit lines
-        content = file_info.get("content", "").split("\n")
-        for line in sorted(list(un_hit_lines)):
-            if 0 < line <= len(content):
-                if file_name not in un_hit_lines_content:
-                    un_hit_lines_content[file_name] = []
-                un_hit_lines_content[file_name].append((line, content[line - 1]))
+        # Extract content for unhit lines. Instead of splitting the whole file
+        # into a line list, walk it once with str.find and slice out only the
+        # lines actually needed; targets past the last line are dropped, as
+        # the old bounds check did.
+        raw = file_info.get("content")
+        if not raw:
+            continue
+        need_iter = iter(ln for ln in sorted(un_hit_lines) if ln > 0)
+        target = next(need_iter, None)
+        collected: List[Tuple[int, str]] = []
+        pos = 0
+        lineno = 1
+        while target is not None:
+            nl = raw.find("\n", pos)
+            if lineno == target:
+                end = nl if nl != -1 else len(raw)
+                collected.append((target, raw[pos:end]))
+                target = next(need_iter, None)
+                if target is None:
+                    break
+            if nl == -1:
+                break
+            pos = nl + 1
+            lineno += 1
+        if collected:
+            un_hit_lines_content[file_name] = collected
 
     if len(modified_related_lines) > 0:
         total_avg /= len(modified_related_lines)
@@ -721,22 +928,38 @@ def compute_coverage_batch(
     """
     results = {}
 
-    for entry in os.listdir(instances_dir):
-        if not entry.startswith("instance_"):
-            continue
-
-        instance_dir = os.path.join(instances_dir, entry)
-        if not os.path.isdir(instance_dir):
-            continue
-
-        # Get modified_related_lines for this instance
-        modified_related_lines = all_modified_related_lines.get(entry, {})
-
-        if not modified_related_lines:
-            continue
+    # Keep only instances that have required lines to score; scandir avoids
+    # the per-entry isdir stat
+    with os.scandir(instances_dir) as dir_iter:
+        candidates = [
+            entry.name for entry in dir_iter
+            if entry.name.startswith("instance_")
+            and entry.is_dir()
+            and all_modified_related_lines.get(entry.name)
+        ]
 
-        score, un_hit = compute_coverage(instance_dir, modified_related_lines, use_key)
-        results[entry] = (score, un_hit)
+    # Same parallelization as parse_all_instances: independent, CPU-bound
+    # work per instance, serial below the pool-startup break-even point.
+    if len(candidates) < 4:
+        for entry in candidates:
+            instance_dir = os.path.join(instances_dir, entry)
+            score, un_hit = compute_coverage(
+                instance_dir, all_modified_related_lines[entry], use_key)
+            results[entry] = (score, un_hit)
+        return results
+
+    with ProcessPoolExecutor() as pool:
+        futures = {
+            entry: pool.submit(
+                compute_coverage,
+                os.path.join(instances_dir, entry),
+                all_modified_related_lines[entry],
+                use_key,
+            )
+            for entry in candidates
+        }
+        for entry, future in futures.items():
+            results[entry] = future.result()
 
     return results
 
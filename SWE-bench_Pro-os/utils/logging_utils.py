@@ -1,8 +1,14 @@
 import logging
 from pathlib import Path
+from typing import Dict, Tuple
 import sys
 
 
+# Loggers already configured by setup_global_logger, keyed on the log file
+# path. Batch workflows call setup per instance; reusing the configured
+# logger skips rebuilding handlers (each FileHandler allocates a lock and
+# re-opens the file) on every call.
+_configured_loggers: Dict[str, Tuple[str, bool, logging.Logger]] = {}
 
 
 def close_logger(logger):
@@ -10,17 +16,32 @@ def close_logger(logger):
     for handler in logger.handlers:
         handler.close()
         logger.removeHandler(handler)
+    # Drop any cache entry for this logger so a later setup_global_logger
+    # call rebuilds the handlers instead of returning a handlerless logger
+    for key, (_, _, cached) in list(_configured_loggers.items()):
+        if cached is logger:
+            del _configured_loggers[key]
 
 
 def setup_global_logger(log_file: Path, mode: str = "w", add_stdout: bool = False):
     """
         Set up the global logger to write logs to a specified file, with optional output to stdout.
 
+        Calling this again for the same file with the same settings returns the
+        already-configured logger; the file handler opens lazily on the first
+        emitted record, so loggers that never log touch no file.
+
             Args:
                 log_file (Path): Path to the log file.
                 mode (str): Mode for writing the log file; defaults to 'w' (overwrite), can be 'a' (append).
                 add_stdout (bool): Whether to also output logs to stdout (console); defaults to False.
     """
+    key = str(log_file)
+    cached = _configured_loggers.get(key)
+    if cached is not None and cached[0] == mode and cached[1] == add_stdout \
+            and cached[2].handlers:
+        return cached[2]
+
     # Ensure the log file directory exists
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -31,8 +52,8 @@ def setup_global_logger(log_file: Path, mode: str = "w", add_stdout: bool = Fals
     # Clear existing handlers to avoid duplicate log entries
     logger.handlers.clear()
 
-    # Create file handler
-    file_handler = logging.FileHandler(log_file, mode=mode, encoding='utf-8')
+    # Create file handler; delay=True defers the open() until the first record
+    file_handler = logging.FileHandler(log_file, mode=mode, encoding='utf-8', delay=True)
     file_handler.setLevel(logging.INFO)  # Log all levels to file
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -54,4 +75,5 @@ def setup_global_logger(log_file: Path, mode: str = "w", add_stdout: bool = Fals
 
     # Optional: prevent log propagation to parent logger (usually no change needed)
     # logger.propagate = False
+    _configured_loggers[key] = (mode, add_stdout, logger)
     return logger
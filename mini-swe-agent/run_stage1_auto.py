@@ -17,12 +17,36 @@ Author: Auto-generated based on STAGE1_AUTOMATION_PLAN.md
 import argparse
 import json
 import logging
+import mmap
+import os
+import pty
+import re
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
+
+# ijson lets the classifier stream preds.json key by key instead of
+# materializing hundreds of MB of mostly unused fields; fall back to the
+# cached json.load parse when it is not installed.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson parses the whole-file fallback path several times faster than the
+# stdlib; both accept UTF-8 bytes, so the call sites are interchangeable.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _HAVE_ORJSON = True
+except ImportError:
+    _json_loads = json.loads
+    _HAVE_ORJSON = False
 
 
 # Pipeline phase definitions - order matters!
@@ -34,6 +58,13 @@ PIPELINE_PHASES = [
     "coverage_eval",   # Phase 5: Coverage evaluation (run tests + verify gold patch + get coverage data)
 ]
 
+# Phase name -> ordinal, so phase checks avoid list.index() scans
+_PHASE_INDEX = {phase: i for i, phase in enumerate(PIPELINE_PHASES)}
+
+# CSI escape sequences (cursor moves, colors) - stripped from log files when
+# the child runs without a terminal
+_ANSI_CSI_RE = re.compile(rb'\x1b\[[0-9;?]*[a-zA-Z]')
+
 
 def should_run_phase(phase_name: str, start_from_phase: Optional[str]) -> bool:
     """
@@ -57,17 +88,16 @@ def should_run_phase(phase_name: str, start_from_phase: Optional[str]) -> bool:
     if start_from_phase is None:
         return True
 
-    if phase_name not in PIPELINE_PHASES:
+    current_index = _PHASE_INDEX.get(phase_name)
+    if current_index is None:
         # Unknown stage name, run by default (backward compatibility)
         return True
 
-    if start_from_phase not in PIPELINE_PHASES:
+    start_index = _PHASE_INDEX.get(start_from_phase)
+    if start_index is None:
         # Invalid starting stage, default to beginning
         return True
 
-    current_index = PIPELINE_PHASES.index(phase_name)
-    start_index = PIPELINE_PHASES.index(start_from_phase)
-
     return current_index >= start_index
 
 
@@ -115,23 +145,100 @@ class Stage1Config:
     script_timeout: int = 7200  # 2 hours
 
 
+@dataclass
+class InstancePartitions:
+    """Every selector view of preds.json, computed in a single pass.
+
+    The list fields preserve preds.json order for display; the ``*_set``
+    views give O(1) membership tests and cheap set arithmetic, built once
+    per snapshot on first use.
+    """
+    failed_test_gen: List[str]
+    gold_failures: List[str]
+    low_coverage: List[str]
+    successful: List[str]
+    all_ids: List[str]
+
+    @cached_property
+    def failed_test_gen_set(self) -> FrozenSet[str]:
+        return frozenset(self.failed_test_gen)
+
+    @cached_property
+    def gold_failures_set(self) -> FrozenSet[str]:
+        return frozenset(self.gold_failures)
+
+    @cached_property
+    def low_coverage_set(self) -> FrozenSet[str]:
+        return frozenset(self.low_coverage)
+
+    @cached_property
+    def successful_set(self) -> FrozenSet[str]:
+        return frozenset(self.successful)
+
+    @cached_property
+    def all_ids_set(self) -> FrozenSet[str]:
+        return frozenset(self.all_ids)
+
+
 class InstanceTracker:
     """Tracks state of all instances through the pipeline"""
 
     def __init__(self, preds_json_path: Path, logger: logging.Logger):
         self.preds_json_path = preds_json_path
         self.logger = logger
+        # Parsed preds.json cached per (mtime, size); the selectors are called
+        # several times per orchestrator iteration on an unchanged file
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_key = None
+        self._partitions: Optional[InstancePartitions] = None
+        self._partitions_key = None
+
+    def invalidate(self):
+        """Drop the cached parse (call after anything rewrites preds.json)."""
+        self._cache = None
+        self._cache_key = None
+        self._partitions = None
+        self._partitions_key = None
 
     def load_from_preds(self) -> Optional[Dict[str, Any]]:
-        """Load and parse preds.json. Returns None if file doesn't exist or parsing fails."""
-        if not self.preds_json_path.exists():
+        """Load and parse preds.json. Returns None if file doesn't exist or parsing fails.
+
+        The file is memory-mapped and handed to the parser directly, so no
+        intermediate bytes copy is made. This is only safe because writers
+        replace the file atomically (write to a temp file, then
+        ``os.replace(tmp, final)``) rather than truncating it in place;
+        any new producer of preds.json must follow the same convention.
+        """
+        # A single open doubles as the existence check; fstat on the open fd
+        # then replaces the separate Path.stat() probe
+        try:
+            f = open(self.preds_json_path, 'rb')
+        except FileNotFoundError:
             self.logger.warning(f"preds.json not found at {self.preds_json_path}")
             return None
 
         try:
-            with open(self.preds_json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with f:
+                stat = os.fstat(f.fileno())
+                cache_key = (stat.st_mtime_ns, stat.st_size)
+                if cache_key == self._cache_key and self._cache is not None:
+                    return self._cache
+
+                if _HAVE_ORJSON:
+                    with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mm:
+                        view = memoryview(mm)
+                        try:
+                            data = _json_loads(view)
+                        finally:
+                            # the view must go before mm closes, even when
+                            # the parse raises
+                            view.release()
+                else:
+                    # stdlib json cannot consume a buffer directly
+                    data = _json_loads(f.read())
             self.logger.debug(f"Loaded {len(data)} instances from preds.json")
+            self._cache = data
+            self._cache_key = cache_key
             return data
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse preds.json: {e}")
@@ -141,100 +248,149 @@ class InstanceTracker:
             self.logger.error(f"Error reading preds.json: {e}")
             return None
 
-    def get_failed_test_gen(self) -> Optional[List[str]]:
-        """Find instances with failed test generation. Returns None if preds.json cannot be loaded."""
-        preds = self.load_from_preds()
-        if preds is None:
+    def classify(self) -> Optional[InstancePartitions]:
+        """Partition all instances in one pass. Returns None if preds.json cannot be loaded.
+
+        With ijson installed the file is streamed instance by instance, so
+        the full preds dict is never held in memory; otherwise the cached
+        json.load parse is used.
+        """
+        if ijson is None:
+            preds = self.load_from_preds()
+            if preds is None:
+                return None
+            # Partitions stay valid as long as the parse cache entry does
+            if self._partitions is not None and self._partitions_key == self._cache_key:
+                return self._partitions
+            return self._build_partitions(preds.items(), self._cache_key)
+
+        try:
+            f = open(self.preds_json_path, 'rb')
+        except FileNotFoundError:
+            self.logger.warning(f"preds.json not found at {self.preds_json_path}")
             return None
 
-        failed = []
+        try:
+            with f:
+                stat = os.fstat(f.fileno())
+                cache_key = (stat.st_mtime_ns, stat.st_size)
+                if self._partitions is not None and self._partitions_key == cache_key:
+                    return self._partitions
+                return self._build_partitions(ijson.kvitems(f, ''), cache_key)
+        except Exception as e:
+            self.logger.error(f"Error reading preds.json: {e}")
+            return None
+
+    def _build_partitions(self, items, cache_key) -> InstancePartitions:
+        """Classify (instance_id, data) pairs and cache the result."""
+        all_ids = []
+        failed_test_gen = []
+        gold_failures = []
+        low_coverage = []
+        successful = []
 
-        for instance_id, data in preds.items():
-            # Check if model_test_patch is empty or missing
-            model_test_patch = data.get('model_test_patch', '').strip()
+        # Pre-bound lookups; the loop body runs once per instance and these
+        # attribute resolutions otherwise repeat for every record
+        dget = dict.get
+        append_all = all_ids.append
+        append_failed = failed_test_gen.append
+        append_gold = gold_failures.append
+        append_low = low_coverage.append
+        append_ok = successful.append
+
+        for instance_id, data in items:
+            append_all(instance_id)
+            # Test generation failed if model_test_patch is empty/missing or
+            # the latest stage has incomplete status
+            model_test_patch = dget(data, 'model_test_patch', '').strip()
             if not model_test_patch:
-                failed.append(instance_id)
-                continue
+                append_failed(instance_id)
+            else:
+                stages = dget(data, 'stage', [])
+                if stages and isinstance(stages, list):
+                    last_stage = stages[-1]
+                    if dget(last_stage, 'status', '') != 'completed':
+                        append_failed(instance_id)
+
+            meta = dget(data, 'meta', {})
+            if dget(meta, 'pass_gold_patch_status', '') == 'success':
+                append_ok(instance_id)
+                # Coverage only matters once the gold patch passes
+                coverage_rate = dget(meta, 'coverage_rate', 'unknown')
+                if isinstance(coverage_rate, (int, float)) and 0 < coverage_rate < 1.0:
+                    append_low(instance_id)
+            else:
+                append_gold(instance_id)
+
+        partitions = InstancePartitions(
+            failed_test_gen=failed_test_gen,
+            gold_failures=gold_failures,
+            low_coverage=low_coverage,
+            successful=successful,
+            all_ids=all_ids,
+        )
+        self._partitions = partitions
+        self._partitions_key = cache_key
+        return partitions
+
+    def refresh(self) -> Optional[InstancePartitions]:
+        """Force a re-read of preds.json and return a fresh partition snapshot.
 
-            # Check if latest stage has incomplete status
-            stages = data.get('stage', [])
-            if stages and isinstance(stages, list):
-                last_stage = stages[-1]
-                status = last_stage.get('status', '')
-                if status != 'completed':
-                    failed.append(instance_id)
+        For orchestrator code that cannot rely on the executor having
+        invalidated the cache (e.g. phase entry after an external change);
+        everything else should read from a classify() snapshot.
+        """
+        self.invalidate()
+        return self.classify()
 
-        return failed
+    def get_failed_test_gen(self) -> Optional[List[str]]:
+        """Find instances with failed test generation. Returns None if preds.json cannot be loaded."""
+        partitions = self.classify()
+        return None if partitions is None else partitions.failed_test_gen
 
     def get_gold_patch_failures(self) -> Optional[List[str]]:
         """Find instances where gold patch validation failed. Returns None if preds.json cannot be loaded."""
-        preds = self.load_from_preds()
-        if preds is None:
-            return None
-
-        failed = []
-
-        for instance_id, data in preds.items():
-            meta = data.get('meta', {})
-            pass_status = meta.get('pass_gold_patch_status', '')
-            if pass_status != 'success':
-                failed.append(instance_id)
-
-        return failed
+        partitions = self.classify()
+        return None if partitions is None else partitions.gold_failures
 
     def get_low_coverage_instances(self) -> Optional[List[str]]:
         """Find instances with coverage < 1.0 and gold patch passing. Returns None if preds.json cannot be loaded."""
-        preds = self.load_from_preds()
-        if preds is None:
-            return None
-
-        low_coverage = []
-
-        for instance_id, data in preds.items():
-            meta = data.get('meta', {})
-
-            # Must pass gold patch first
-            pass_status = meta.get('pass_gold_patch_status', '')
-            if pass_status != 'success':
-                continue
-
-            # Check coverage rate
-            coverage_rate = meta.get('coverage_rate', 'unknown')
-            if isinstance(coverage_rate, (int, float)) and 0 < coverage_rate < 1.0:
-                low_coverage.append(instance_id)
-
-        return low_coverage
+        partitions = self.classify()
+        return None if partitions is None else partitions.low_coverage
 
     def get_successful_instances(self) -> List[str]:
         """Get instances that passed gold patch. Returns empty list if preds.json cannot be loaded."""
-        preds = self.load_from_preds()
-        if preds is None:
-            return []
-
-        successful = []
-
-        for instance_id, data in preds.items():
-            meta = data.get('meta', {})
-            pass_status = meta.get('pass_gold_patch_status', '')
-            if pass_status == 'success':
-                successful.append(instance_id)
-
-        return successful
+        partitions = self.classify()
+        return [] if partitions is None else partitions.successful
 
     def get_all_instances(self) -> List[str]:
         """Get all instance IDs from preds.json. Returns empty list if preds.json cannot be loaded."""
-        preds = self.load_from_preds()
-        if preds is None:
-            return []
-        return list(preds.keys())
+        partitions = self.classify()
+        return [] if partitions is None else partitions.all_ids
 
 
 class ScriptExecutor:
     """Executes shell scripts and captures results"""
 
-    def __init__(self, config: Stage1Config, logger: logging.Logger):
+    # Above this many ids the comma-joined argv form risks ARG_MAX limits;
+    # children that support it get the id list as a file instead
+    ID_FILE_THRESHOLD = 200
+
+    def __init__(self, config: Stage1Config, logger: logging.Logger,
+                 tracker: Optional[InstanceTracker] = None):
         self.config = config
         self.logger = logger
+        self.tracker = tracker
+        self._tmp_id_files: List[Path] = []
+
+    def _write_id_file(self, instance_ids: List[str], phase: str) -> Path:
+        """Write instance ids newline-separated under output_dir/.tmp."""
+        tmp_dir = self.config.output_dir / ".tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        id_file = tmp_dir / f"ids_{phase}_{int(time.time())}.txt"
+        id_file.write_text("\n".join(instance_ids) + "\n", encoding="utf-8")
+        self._tmp_id_files.append(id_file)
+        return id_file
 
     def run_test_generation(self, instance_ids: Optional[List[str]], redo_existing: bool = True) -> bool:
         """Execute run_agent.sh for specified instances (or all if instance_ids is None/empty)"""
@@ -306,7 +462,11 @@ class ScriptExecutor:
 
         # Only add --run_instance if specific instances are provided
         if instance_ids is not None and len(instance_ids) > 0:
-            cmd.extend(["--run_instance", ",".join(instance_ids)])
+            if len(instance_ids) >= self.ID_FILE_THRESHOLD:
+                id_file = self._write_id_file(instance_ids, "test_gen")
+                cmd.extend(["--run_instance_file", str(id_file)])
+            else:
+                cmd.extend(["--run_instance", ",".join(instance_ids)])
 
         return cmd
 
@@ -329,7 +489,14 @@ class ScriptExecutor:
         return cmd
 
     def _build_eval_command(self, instance_ids: Optional[List[str]], coverage_eval: bool) -> List[str]:
-        """Build command for evaluation - different for swebench vs swebenchpro"""
+        """Build command for evaluation - different for swebench vs swebenchpro
+
+        Evaluation is deliberately run as a single child process rather than
+        sharded across an orchestrator-side process pool: both eval scripts
+        already fan out internally (--num_workers / --max_workers below) and
+        rewrite the shared preds.json, so outer sharding would only oversubscribe
+        docker and force a merge step for the per-shard preds files.
+        """
 
         if self.config.benchmark == "swebenchpro":
             # Use SWE-bench_Pro-os evaluation
@@ -365,16 +532,52 @@ class ScriptExecutor:
             ]
 
         if instance_ids:
-            cmd.extend(["--instance_ids", ",".join(instance_ids)])
+            if self.config.benchmark == "swebenchpro" and len(instance_ids) >= self.ID_FILE_THRESHOLD:
+                # eval_model_test_patch accepts the list as a file; the
+                # swe-bench runner only takes the comma form
+                id_file = self._write_id_file(instance_ids, "gold_eval")
+                cmd.extend(["--run_instance_file", str(id_file)])
+            else:
+                cmd.extend(["--instance_ids", ",".join(instance_ids)])
 
         return cmd
 
+    def _pump_output(self, read_fd: int, log_f, strip_ansi: bool = False) -> None:
+        """Tee raw bytes from read_fd (PTY master or pipe) to stdout and the log.
+
+        Runs on a dedicated thread so the main thread can enforce
+        script_timeout on the child itself rather than only after output
+        stops. Blocking reads mean the kernel wakes the pump only when the
+        child produces output, and a closed PTY or pipe surfaces as
+        EOF/EIO which ends the loop.
+        """
+        stdout_buf = sys.stdout.buffer
+        last_flush = time.monotonic()
+        while True:
+            try:
+                data = os.read(read_fd, 65536)
+            except OSError:
+                # PTY closed (child exited)
+                break
+            if not data:
+                break
+            try:
+                # Console gets the raw bytes (ANSI codes keep progress bars
+                # working); the log gets the same bytes with a timed flush,
+                # minus escape sequences when there is no terminal in play
+                stdout_buf.write(data)
+                stdout_buf.flush()
+                log_f.write(_ANSI_CSI_RE.sub(b'', data) if strip_ansi else data)
+            except ValueError:
+                # log file closed during shutdown
+                break
+            now = time.monotonic()
+            if now - last_flush >= 0.5:
+                log_f.flush()
+                last_flush = now
+
     def _execute_command(self, cmd: List[str], phase: str) -> subprocess.CompletedProcess:
         """Execute command with real-time output and logging using PTY for progress bar support"""
-        import pty
-        import os
-        import select
-
         self.logger.info(f"Executing: {' '.join(cmd)}")
 
         # Determine working directory based on phase
@@ -392,74 +595,64 @@ class ScriptExecutor:
         log_file = logs_dir / f"{phase}_{int(time.time())}.log"
 
         try:
-            # Use PTY to make subprocess think it's running in a terminal
-            # This allows Rich's Live and Progress bars to work properly
-            master_fd, slave_fd = pty.openpty()
-
-            # Start process with PTY
-            process = subprocess.Popen(
-                cmd,
-                stdin=slave_fd,
-                stdout=slave_fd,
-                stderr=slave_fd,
-                cwd=str(cwd),
-                close_fds=True
-            )
-
-            # Close slave fd in parent process (child has its own copy)
-            os.close(slave_fd)
-
-            # Open log file for writing
-            with open(log_file, 'w', buffering=1) as log_f:
-                # Read from master fd and write to both console and log file
-                while True:
-                    # Use select to check if data is available (with timeout)
-                    ready, _, _ = select.select([master_fd], [], [], 0.1)
-
-                    if ready:
-                        try:
-                            # Read available data
-                            data = os.read(master_fd, 1024)
-                            if not data:
-                                break
-
-                            # Decode and process output
-                            text = data.decode('utf-8', errors='replace')
-
-                            # Write to console (with ANSI codes for progress bars)
-                            sys.stdout.write(text)
-                            sys.stdout.flush()
-
-                            # Write to log file (includes ANSI codes for completeness)
-                            log_f.write(text)
-                            log_f.flush()
-
-                        except OSError:
-                            # PTY closed
-                            break
-
-                    # Check if process has finished
-                    if process.poll() is not None:
-                        # Process finished, read any remaining data
-                        try:
-                            while True:
-                                data = os.read(master_fd, 1024)
-                                if not data:
-                                    break
-                                text = data.decode('utf-8', errors='replace')
-                                sys.stdout.write(text)
-                                sys.stdout.flush()
-                                log_f.write(text)
-                                log_f.flush()
-                        except OSError:
-                            pass
-                        break
+            use_pty = sys.stdout.isatty()
+            if use_pty:
+                # Use PTY to make subprocess think it's running in a terminal
+                # This allows Rich's Live and Progress bars to work properly
+                master_fd, slave_fd = pty.openpty()
+
+                # Start process with PTY
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=slave_fd,
+                    stdout=slave_fd,
+                    stderr=slave_fd,
+                    cwd=str(cwd),
+                    close_fds=True
+                )
+
+                # Close slave fd in parent process (child has its own copy)
+                os.close(slave_fd)
+                read_fd = master_fd
+            else:
+                # Under CI / nohup / redirection there is no terminal to
+                # render progress bars on, so skip the PTY and its termios
+                # overhead entirely and read from a plain pipe
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    cwd=str(cwd),
+                    bufsize=0,
+                    close_fds=True
+                )
+                read_fd = process.stdout.fileno()
+
+            # Open log file in binary mode; the raw bytes go in untouched and
+            # the 8KB buffer plus a timed flush batches the many short writes
+            # chatty progress bars produce
+            with open(log_file, 'wb', buffering=8192) as log_f:
+                # Tee on a dedicated thread; with the main thread free to
+                # wait on the process, script_timeout now bounds a child
+                # that hangs while holding the PTY open
+                pump = threading.Thread(
+                    target=self._pump_output, args=(read_fd, log_f, not use_pty), daemon=True
+                )
+                pump.start()
 
                 # Wait for process to complete
                 returncode = process.wait(timeout=self.config.script_timeout)
 
-            # Close master fd
-            os.close(master_fd)
+                # Let the pump drain the remaining PTY output; EOF/EIO ends
+                # it once the last writer is gone
+                pump.join(timeout=10)
+
+            # Close our end of the child's output
+            if use_pty:
+                os.close(master_fd)
+            else:
+                process.stdout.close()
 
             # Create result object
             result = subprocess.CompletedProcess(
@@ -497,6 +690,17 @@ class ScriptExecutor:
                 except:
                     pass
             return subprocess.CompletedProcess(cmd, returncode=1)
+        finally:
+            # The subprocess may have rewritten preds.json
+            if self.tracker is not None:
+                self.tracker.invalidate()
+            # Drop any id list files written for this command
+            for id_file in self._tmp_id_files:
+                try:
+                    id_file.unlink()
+                except OSError:
+                    pass
+            self._tmp_id_files.clear()
 
 
 class Stage1Orchestrator:
@@ -506,7 +710,7 @@ class Stage1Orchestrator:
         self.config = config
         self.logger = self._setup_logger()
         self.tracker = InstanceTracker(config.preds_json_path, self.logger)
-        self.executor = ScriptExecutor(config, self.logger)
+        self.executor = ScriptExecutor(config, self.logger, self.tracker)
         self.stats = {
             'test_gen_iterations': 0,
             'hard_code_fix_iterations': 0,
@@ -517,6 +721,27 @@ class Stage1Orchestrator:
             'permanently_failed': [],
         }
 
+    def _preds_mtime_ns(self) -> Optional[int]:
+        """Snapshot preds.json's mtime in nanoseconds, or None if absent."""
+        try:
+            return self.config.preds_json_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _wait_for_preds_update(self, prev_mtime_ns: Optional[int], timeout: float = 2.0) -> None:
+        """Wait until preds.json's mtime moves past the pre-run snapshot.
+
+        Replaces the fixed 2-second "file system sync" sleep: the rewrite is
+        usually visible as soon as the subprocess exits, so polling at 25ms
+        returns almost immediately on the common path while keeping the old
+        2-second upper bound for slow or networked file systems.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._preds_mtime_ns() not in (None, prev_mtime_ns):
+                return
+            time.sleep(0.025)
+
     def run(self) -> bool:
         """Execute full Stage 1 pipeline"""
         self.logger.info("="*80)
@@ -623,20 +848,21 @@ class Stage1Orchestrator:
             self.stats['test_gen_iterations'] = 1
 
             # Run test generation without specifying instance_ids (will process all)
+            prev_mtime = self._preds_mtime_ns()
             success = self.executor.run_test_generation(None, redo_existing=True)
             if not success:
                 self.logger.error("✗ Initial test generation failed")
                 return False
 
-            # Wait for file system sync
-            self.logger.info("Waiting 2 seconds for file system sync...")
-            time.sleep(2)
+            # Wait for the preds.json rewrite to become visible
+            self._wait_for_preds_update(prev_mtime)
 
             # Check if all instances succeeded after initial generation
-            failed_ids = self.tracker.get_failed_test_gen()
-            if failed_ids is None:
+            partitions = self.tracker.classify()
+            if partitions is None:
                 self.logger.error("✗ Cannot load or parse preds.json after initial generation")
                 return False
+            failed_ids = partitions.failed_test_gen
 
             if not failed_ids:
                 self.logger.info("✓ All instances have successful test generation!")
@@ -648,47 +874,58 @@ class Stage1Orchestrator:
         else:
             iteration_start = 1
 
+        prev_failed: Optional[FrozenSet[str]] = None
         for iteration in range(iteration_start, self.config.max_test_gen_retries + 1):
             self.stats['test_gen_iterations'] = iteration
             self.logger.info(f"\n{'='*60}")
             self.logger.info(f"Test Generation Iteration {iteration}/{self.config.max_test_gen_retries}")
             self.logger.info('='*60)
 
-            failed_ids = self.tracker.get_failed_test_gen()
+            partitions = self.tracker.classify()
 
-            if failed_ids is None:
+            if partitions is None:
                 self.logger.error("✗ Cannot load or parse preds.json - stopping test generation phase")
                 self.logger.error("The JSON file may be corrupted. Check test_generation logs for errors.")
                 return False
+            failed_ids = partitions.failed_test_gen
 
             if not failed_ids:
                 self.logger.info("✓ All instances have successful test generation!")
                 return True
 
+            # Retrying is pointless once an iteration makes no progress; the
+            # same set of instances would just fail again until max retries
+            if partitions.failed_test_gen_set == prev_failed:
+                self.logger.warning(f"⚠ No progress in iteration {iteration - 1}: "
+                                    f"the same {len(failed_ids)} instances still fail - stopping retries")
+                break
+            prev_failed = partitions.failed_test_gen_set
+
             self.logger.info(f"Found {len(failed_ids)} instances needing test generation:")
             for i, instance_id in enumerate(failed_ids[:10], 1):
-                self.logger.info(f"  {i}. {instance_id}")
+                self.logger.info("  %d. %s", i, instance_id)
             if len(failed_ids) > 10:
-                self.logger.info(f"  ... and {len(failed_ids) - 10} more")
+                self.logger.info("  ... and %d more", len(failed_ids) - 10)
 
             # Run test generation for failed instances
+            prev_mtime = self._preds_mtime_ns()
             success = self.executor.run_test_generation(failed_ids, redo_existing=True)
 
             if not success:
                 self.logger.warning(f"⚠ Test generation script failed in iteration {iteration}")
 
-            # Wait for file system sync
-            self.logger.info("Waiting 2 seconds for file system sync...")
-            time.sleep(2)
+            # Wait for the preds.json rewrite to become visible
+            self._wait_for_preds_update(prev_mtime)
 
-        # Final check
-        failed_ids = self.tracker.get_failed_test_gen()
-        if failed_ids is None:
+        # Final check; one classify() pass serves both selectors
+        partitions = self.tracker.classify()
+        if partitions is None:
             self.logger.error("✗ Cannot load or parse preds.json after all retries")
             return False
+        failed_ids = partitions.failed_test_gen
 
         # Check if ALL instances failed
-        all_instances = self.tracker.get_all_instances()
+        all_instances = partitions.all_ids
         if failed_ids and len(failed_ids) == len(all_instances):
             self.logger.error(f"✗ ALL {len(all_instances)} instances failed test generation")
             self.logger.error("✗ Cannot proceed to next phase without any successful test generation")
@@ -706,68 +943,96 @@ class Stage1Orchestrator:
         """Phase 2: Run hard code fix on all instances"""
 
         self.logger.info("Running Hard_Code_Fix on all instances...")
+        prev_mtime = self._preds_mtime_ns()
         if not self.executor.run_hard_code_fix(instance_ids=None):
             self.logger.error("✗ Hard_Code_Fix script failed (script-level error)")
             self.logger.error("This indicates a serious problem (e.g., missing file, invalid arguments)")
             return False
 
-        time.sleep(2)
+        self._wait_for_preds_update(prev_mtime)
         self.logger.info("✓ Hard code fix phase completed")
         return True
 
     def _phase_gold_eval(self) -> bool:
         """Phase 3: Gold patch validation with retries and combined re-gen+fix for persistent failures"""
 
-        # Initial validation
-        self.logger.info("Running initial gold patch validation...")
-        eval_result = self.executor.run_gold_eval(coverage_eval=False)
-        if not eval_result["success"]:
-            self.logger.error("✗ Gold patch evaluation script failed (script-level error)")
-            return False
-        time.sleep(2)
+        # When resuming, preds.json may already record a full pass: instances
+        # that were never evaluated lack pass_gold_patch_status and count as
+        # failures, so an empty failure set means every instance has been
+        # evaluated and passed - the initial multi-minute eval adds nothing.
+        partitions = self.tracker.classify()
+        if partitions is not None and partitions.all_ids and not partitions.gold_failures:
+            self.logger.info("✓ preds.json already shows all instances passing - skipping initial gold eval")
+        else:
+            # Initial validation
+            self.logger.info("Running initial gold patch validation...")
+            prev_mtime = self._preds_mtime_ns()
+            eval_result = self.executor.run_gold_eval(coverage_eval=False)
+            if not eval_result["success"]:
+                self.logger.error("✗ Gold patch evaluation script failed (script-level error)")
+                return False
+            self._wait_for_preds_update(prev_mtime)
 
-        # Retry logic: re-run hard code fix for failures
+        # Retry logic: re-run hard code fix for failures. Each iteration reads
+        # one classify() pass; the executor already invalidated the cache
+        # after the eval subprocess rewrote preds.json.
+        prev_failed: Optional[FrozenSet[str]] = None
         for iteration in range(1, self.config.max_hard_code_fix_retries + 1):
             self.stats['hard_code_fix_iterations'] = iteration
 
-            failed_ids = self.tracker.get_gold_patch_failures()
-            if failed_ids is None:
+            partitions = self.tracker.classify()
+            if partitions is None:
                 self.logger.error("✗ Cannot load or parse preds.json - stopping gold eval phase")
                 return False
+            failed_ids = partitions.gold_failures
 
             if not failed_ids:
                 self.logger.info("✓ All instances pass gold patch validation!")
                 return True
 
+            if partitions.gold_failures_set == prev_failed:
+                self.logger.warning(f"⚠ No progress in retry {iteration - 1}: "
+                                    f"the same {len(failed_ids)} instances still fail - moving on")
+                break
+            prev_failed = partitions.gold_failures_set
+
             self.logger.info(f"\n{'='*60}")
             self.logger.info(f"Gold Validation Retry {iteration}/{self.config.max_hard_code_fix_retries}")
             self.logger.info('='*60)
             self.logger.info(f"Found {len(failed_ids)} instances failing gold patch:")
             for i, instance_id in enumerate(failed_ids[:10], 1):
-                self.logger.info(f"  {i}. {instance_id}")
+                self.logger.info("  %d. %s", i, instance_id)
             if len(failed_ids) > 10:
-                self.logger.info(f"  ... and {len(failed_ids) - 10} more")
+                self.logger.info("  ... and %d more", len(failed_ids) - 10)
 
             # Re-run hard code fix for failed instances
             self.logger.info("Re-running Hard_Code_Fix for failed instances...")
+            prev_mtime = self._preds_mtime_ns()
             if not self.executor.run_hard_code_fix(instance_ids=failed_ids):
                 self.logger.error("✗ Hard_Code_Fix script failed (script-level error)")
                 return False
-            time.sleep(2)
+            self._wait_for_preds_update(prev_mtime)
 
             # Re-validate
             self.logger.info("Re-validating...")
+            prev_mtime = self._preds_mtime_ns()
             eval_result = self.executor.run_gold_eval(instance_ids=failed_ids, coverage_eval=False)
             if not eval_result["success"]:
                 self.logger.error("✗ Gold patch evaluation script failed (script-level error)")
                 return False
-            time.sleep(2)
-
-        # Combined re-gen + re-fix for persistent failures
-        failed_ids = self.tracker.get_gold_patch_failures()
-        if failed_ids is None:
+            self._wait_for_preds_update(prev_mtime)
+
+        # Combined re-gen + re-fix for persistent failures. The three steps
+        # run as one serial batch per iteration rather than concurrent
+        # per-shard pipelines: each executor call already fans out over its
+        # instances via --workers / --num_workers, and the eval step rewrites
+        # the shared preds.json, so concurrent shards would race on that file
+        # on top of oversubscribing the workers.
+        partitions = self.tracker.classify()
+        if partitions is None:
             self.logger.error("✗ Cannot load or parse preds.json")
             return False
+        failed_ids = partitions.gold_failures
 
         if failed_ids and self.config.max_combined_retries > 0:
             self.logger.info(f"\n{'='*60}")
@@ -780,43 +1045,48 @@ class Stage1Orchestrator:
 
                 # Step 1: Re-generate tests
                 self.logger.info("Step 1: Re-generating tests...")
+                prev_mtime = self._preds_mtime_ns()
                 if not self.executor.run_test_generation(failed_ids, redo_existing=True):
                     self.logger.error("✗ Test generation script failed (script-level error)")
                     return False
-                time.sleep(2)
+                self._wait_for_preds_update(prev_mtime)
 
                 # Step 2: Re-fix
                 self.logger.info("Step 2: Re-applying hard code fix...")
+                prev_mtime = self._preds_mtime_ns()
                 if not self.executor.run_hard_code_fix(instance_ids=failed_ids):
                     self.logger.error("✗ Hard_Code_Fix script failed (script-level error)")
                     return False
-                time.sleep(2)
+                self._wait_for_preds_update(prev_mtime)
 
                 # Step 3: Re-validate
                 self.logger.info("Step 3: Re-validating...")
+                prev_mtime = self._preds_mtime_ns()
                 eval_result = self.executor.run_gold_eval(instance_ids=failed_ids, coverage_eval=False)
                 if not eval_result["success"]:
                     self.logger.error("✗ Gold patch evaluation script failed (script-level error)")
                     return False
-                time.sleep(2)
+                self._wait_for_preds_update(prev_mtime)
 
                 # Check if resolved
-                failed_ids = self.tracker.get_gold_patch_failures()
-                if failed_ids is None:
+                partitions = self.tracker.classify()
+                if partitions is None:
                     self.logger.error("✗ Cannot load or parse preds.json")
                     return False
+                failed_ids = partitions.gold_failures
                 if not failed_ids:
                     self.logger.info("✓ All instances now pass gold patch validation!")
                     return True
 
-        # Final check
-        failed_ids = self.tracker.get_gold_patch_failures()
-        if failed_ids is None:
+        # Final check; one classify() pass serves both selectors
+        partitions = self.tracker.classify()
+        if partitions is None:
             self.logger.error("✗ Cannot load or parse preds.json")
             return False
+        failed_ids = partitions.gold_failures
 
         # Check if ALL instances failed
-        all_instances = self.tracker.get_all_instances()
+        all_instances = partitions.all_ids
         if failed_ids and len(failed_ids) == len(all_instances):
             self.logger.error(f"✗ ALL {len(all_instances)} instances failed gold patch validation")
             self.logger.error("✗ No instances passed - stopping pipeline")
@@ -833,10 +1103,11 @@ class Stage1Orchestrator:
     def _phase_coverage_fix(self) -> bool:
         """Phase 4: Agent generates improved test patches to increase coverage"""
 
-        low_coverage_ids = self.tracker.get_low_coverage_instances()
-        if low_coverage_ids is None:
+        partitions = self.tracker.classify()
+        if partitions is None:
             self.logger.error("✗ Cannot load or parse preds.json - stopping coverage fix phase")
             return False
+        low_coverage_ids = partitions.low_coverage
 
         if not low_coverage_ids:
             self.logger.info("✓ No instances need coverage fixing (all at 100% or unknown)")
@@ -844,17 +1115,18 @@ class Stage1Orchestrator:
 
         self.logger.info(f"Found {len(low_coverage_ids)} instances with coverage < 100%:")
         for i, instance_id in enumerate(low_coverage_ids[:10], 1):
-            self.logger.info(f"  {i}. {instance_id}")
+            self.logger.info("  %d. %s", i, instance_id)
         if len(low_coverage_ids) > 10:
-            self.logger.info(f"  ... and {len(low_coverage_ids) - 10} more")
+            self.logger.info("  ... and %d more", len(low_coverage_ids) - 10)
 
         # Run coverage fix (agent work only - no test execution here)
         self.logger.info("Running coverage fix (agent generating improved test patches)...")
+        prev_mtime = self._preds_mtime_ns()
         if not self.executor.run_coverage_fix(instance_ids=low_coverage_ids):
             self.logger.error("✗ Coverage_Fix script failed (script-level error)")
             return False
 
-        time.sleep(2)
+        self._wait_for_preds_update(prev_mtime)
         self.logger.info("✓ Coverage fix phase completed (test patches generated)")
         self.logger.info("→ Next: Run Phase 5 (coverage_eval) to execute tests and verify coverage")
         return True
@@ -869,37 +1141,36 @@ class Stage1Orchestrator:
         self.logger.info("  3. Collect coverage data")
 
         # Run evaluation with coverage (this executes tests + verifies gold patch + gets coverage)
+        prev_mtime = self._preds_mtime_ns()
         eval_result = self.executor.run_gold_eval(coverage_eval=True)
         if not eval_result["success"]:
             self.logger.error("✗ Coverage evaluation failed (script-level error)")
             return False
-        time.sleep(2)
+        self._wait_for_preds_update(prev_mtime)
 
-        # Check gold patch results
-        failed_ids = self.tracker.get_gold_patch_failures()
-        if failed_ids is None:
+        # Check gold patch and coverage results from one classify() pass
+        partitions = self.tracker.classify()
+        if partitions is None:
             self.logger.error("✗ Cannot load or parse preds.json")
             return False
+        failed_ids = partitions.gold_failures
 
         if failed_ids:
             self.logger.warning(f"⚠ Warning: {len(failed_ids)} instances failed gold patch validation")
             for i, instance_id in enumerate(failed_ids[:10], 1):
-                self.logger.warning(f"  {i}. {instance_id}")
+                self.logger.warning("  %d. %s", i, instance_id)
             if len(failed_ids) > 10:
-                self.logger.warning(f"  ... and {len(failed_ids) - 10} more")
+                self.logger.warning("  ... and %d more", len(failed_ids) - 10)
 
         # Check coverage results
-        low_coverage_ids = self.tracker.get_low_coverage_instances()
-        if low_coverage_ids is None:
-            self.logger.error("✗ Cannot load or parse preds.json")
-            return False
+        low_coverage_ids = partitions.low_coverage
 
         if low_coverage_ids:
             self.logger.info(f"⚠ {len(low_coverage_ids)} instances still have incomplete coverage")
         else:
             self.logger.info("✓ All instances achieved full coverage!")
 
-        all_instances = self.tracker.get_all_instances()
+        all_instances = partitions.all_ids
         passed_count = len(all_instances) - len(failed_ids) if failed_ids else len(all_instances)
         self.logger.info(f"✓ Coverage evaluation completed: {passed_count}/{len(all_instances)} instances passing")
 
@@ -907,22 +1178,21 @@ class Stage1Orchestrator:
 
     def _generate_final_report(self):
         """Generate and log final statistics"""
-        successful = self.tracker.get_successful_instances()
-        failed = self.tracker.get_gold_patch_failures()
-        low_coverage = self.tracker.get_low_coverage_instances()
-
-        # Handle None cases (JSON parse errors) - use empty lists as fallback for reporting
-        # Note: get_successful_instances() already returns [] on error, so only check failed and low_coverage
-        if failed is None:
-            self.logger.warning("⚠ Cannot load preds.json for failed instances - using empty list")
-            failed = []
-        if low_coverage is None:
-            self.logger.warning("⚠ Cannot load preds.json for low coverage instances - using empty list")
-            low_coverage = []
+        partitions = self.tracker.classify()
+
+        # Handle None case (JSON parse errors) - use empty lists as fallback for reporting
+        if partitions is None:
+            self.logger.warning("⚠ Cannot load preds.json for final report - using empty lists")
+            successful, failed, low_coverage, all_ids = [], [], [], []
+        else:
+            successful = partitions.successful
+            failed = partitions.gold_failures
+            low_coverage = partitions.low_coverage
+            all_ids = partitions.all_ids
 
         self.stats['successful_instances'] = len(successful)
         self.stats['failed_instances'] = len(failed)
-        self.stats['total_instances'] = len(self.tracker.get_all_instances())
+        self.stats['total_instances'] = len(all_ids)
 
         self.logger.info("\n" + "="*80)
         self.logger.info("STAGE 1 AUTOMATION FINAL REPORT")
@@ -945,18 +1215,18 @@ class Stage1Orchestrator:
             self.logger.info("Failed Instance IDs:")
             self.logger.info("-"*60)
             for i, instance_id in enumerate(failed[:20], 1):
-                self.logger.info(f"  {i}. {instance_id}")
+                self.logger.info("  %d. %s", i, instance_id)
             if len(failed) > 20:
-                self.logger.info(f"  ... and {len(failed) - 20} more")
+                self.logger.info("  ... and %d more", len(failed) - 20)
 
         if low_coverage:
             self.logger.info("\n" + "-"*60)
             self.logger.info("Low Coverage Instance IDs:")
             self.logger.info("-"*60)
             for i, instance_id in enumerate(low_coverage[:20], 1):
-                self.logger.info(f"  {i}. {instance_id}")
+                self.logger.info("  %d. %s", i, instance_id)
             if len(low_coverage) > 20:
-                self.logger.info(f"  ... and {len(low_coverage) - 20} more")
+                self.logger.info("  ... and %d more", len(low_coverage) - 20)
 
         # Save report to JSON
         report_path = self.config.output_dir / "stage1_automation_report.json"
@@ -5,7 +5,7 @@ Python-specific code analyzer using tree-sitter.
 
 import tree_sitter_python as tspython
 from tree_sitter import Language, Parser
-from typing import Dict, Set, Tuple, Any, List
+from typing import Dict, Set, Tuple, Optional, Any, List
 
 from .base import BaseLanguageAnalyzer, ScopeInfo, ScopeType
 
@@ -174,31 +174,46 @@ class PythonAnalyzer(BaseLanguageAnalyzer):
 
         collect_scopes(tree.root_node)
 
-        # Sort by scope size (smaller first) so inner scopes override outer
-        scopes.sort(key=lambda s: (s.end_line - s.start_line, s.start_line))
-
-        total_lines = len(src.splitlines())
-        line2scope: Dict[int, Tuple[str, str]] = {}
-
-        for i in range(1, total_lines + 1):
-            line2scope[i] = ("global", "__global__")
-
-            for scope in scopes:
-                if scope.start_line <= i <= scope.end_line:
-                    # Build qualified name with prefix to distinguish same-name functions
-                    qualified_name = scope.name
-                    if scope.scope_type == ScopeType.FUNCTION:
-                        if scope.parent and scope.parent.scope_type == ScopeType.CLASS:
-                            # Method inside a class: ClassName.method_name
-                            qualified_name = f"{scope.parent.name}.{scope.name}"
-                        else:
-                            # Global function: global.func_name
-                            qualified_name = f"global.{scope.name}"
-
-                    line2scope[i] = (scope.scope_type.value, qualified_name)
-                    # Function scope has priority, so break if we hit a function
-                    if scope.scope_type == ScopeType.FUNCTION:
-                        break
+        # Sort by scope size (smaller first) so inner scopes override outer.
+        # collect_scopes appends in pre-order (ascending start_line) and sort()
+        # is stable, so a plain int key keeps the start_line tiebreak without
+        # allocating and comparing a tuple per scope.
+        scopes.sort(key=lambda s: s.end_line - s.start_line)
+
+        total_lines = self._line_count(src)
+        line2scope: Dict[int, Tuple[str, str]] = {
+            i: ("global", "__global__") for i in range(1, total_lines + 1)
+        }
+
+        # Hoist the per-scope work (type check, qualified name) out of the line
+        # loop: compute each scope's entry once, then paint its line range.
+        entries = []
+        for scope in scopes:
+            # Build qualified name with prefix to distinguish same-name functions
+            qualified_name = scope.name
+            if scope.scope_type == ScopeType.FUNCTION:
+                if scope.parent and scope.parent.scope_type == ScopeType.CLASS:
+                    # Method inside a class: ClassName.method_name
+                    qualified_name = f"{scope.parent.name}.{scope.name}"
+                else:
+                    # Global function: global.func_name
+                    qualified_name = f"global.{scope.name}"
+            entries.append((scope, (scope.scope_type.value, qualified_name),
+                            scope.scope_type == ScopeType.FUNCTION))
+
+        def paint(scope, value):
+            for i in range(max(1, scope.start_line), min(total_lines, scope.end_line) + 1):
+                line2scope[i] = value
+
+        # Painting non-function scopes small->large keeps the outermost class for
+        # lines outside any function; painting function scopes large->small after
+        # lets the innermost function win - same result as the old per-line scan.
+        for scope, value, is_function in entries:
+            if not is_function:
+                paint(scope, value)
+        for scope, value, is_function in reversed(entries):
+            if is_function:
+                paint(scope, value)
 
         return line2scope
 
@@ -307,7 +322,8 @@ class PythonAnalyzer(BaseLanguageAnalyzer):
         self,
         line2scope: Dict[int, Tuple[str, str]],
         nodes_by_lineno: Dict[int, Any],
-        modified_lines: Set[int]
+        modified_lines: Set[int],
+        src: Optional[str] = None
     ) -> Set[int]:
         """
         Filter out "ignorable" global-level statements.
@@ -322,6 +338,7 @@ class PythonAnalyzer(BaseLanguageAnalyzer):
         - Docstrings
         """
         filtered = set()
+        root = self.parse(src).root_node if src is not None else None
 
         for ln in modified_lines:
             scope_type, _ = line2scope.get(ln, ("global", ""))
@@ -332,7 +349,7 @@ class PythonAnalyzer(BaseLanguageAnalyzer):
                 continue
 
             # Check the node at this line
-            node = nodes_by_lineno.get(ln)
+            node = self._node_at_line(root, nodes_by_lineno, ln)
             if node is None:
                 # Empty line or comment - skip
                 continue
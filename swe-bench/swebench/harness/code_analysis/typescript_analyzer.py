@@ -6,7 +6,7 @@ Extends JavaScript analyzer with TypeScript-specific features.
 
 import tree_sitter_typescript as tsts
 from tree_sitter import Language, Parser
-from typing import Dict, Set, Tuple, Any
+from typing import Dict, Set, Tuple, Optional, Any
 
 from .base import ScopeType
 from .javascript_analyzer import JavaScriptAnalyzer, JS_EXECUTABLE_NODES, JS_SCOPE_NODES
@@ -73,7 +73,8 @@ class TypeScriptAnalyzer(JavaScriptAnalyzer):
         self,
         line2scope: Dict[int, Tuple[str, str]],
         nodes_by_lineno: Dict[int, Any],
-        modified_lines: Set[int]
+        modified_lines: Set[int],
+        src: Optional[str] = None
     ) -> Set[int]:
         """
         Filter out "ignorable" global-level statements.
@@ -81,6 +82,7 @@ class TypeScriptAnalyzer(JavaScriptAnalyzer):
         TypeScript-specific: also filters type-only declarations.
         """
         filtered = set()
+        root = self.parse(src).root_node if src is not None else None
 
         for ln in modified_lines:
             scope_type, _ = line2scope.get(ln, ("global", ""))
@@ -89,7 +91,7 @@ class TypeScriptAnalyzer(JavaScriptAnalyzer):
                 filtered.add(ln)
                 continue
 
-            node = nodes_by_lineno.get(ln)
+            node = self._node_at_line(root, nodes_by_lineno, ln)
             if node is None:
                 continue
 
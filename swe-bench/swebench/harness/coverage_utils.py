@@ -7,11 +7,12 @@ Supports multi-language code analysis using tree-sitter for:
 """
 
 from collections import defaultdict
-import copy
+import hashlib
 import json
 import re
+import shlex
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unidiff import PatchSet
 from typing import Dict, Set, Tuple, Optional, Any
 
 from swebench.harness.constants import (
@@ -26,38 +27,66 @@ from swebench.harness.code_analysis import (
 )
 
 
+# Memoized analysis results keyed on a digest of the source plus the language
+# and modified-line set. Re-runs over an unchanged file version skip the
+# tree-sitter parse and def/use extraction entirely, and the digest key keeps
+# whole file contents from being pinned in cache memory. Entries are shared,
+# so treat results as read-only. Cleared wholesale once full, matching the
+# analyzer memos.
+_ANALYSIS_CACHE_LIMIT = 512
+_analysis_cache: Dict[Tuple[str, str, frozenset], AnalysisResult] = {}
 
-def parse_patch_log(log_content: str) -> dict:
-    # Regex: match hunk header lines
-    hunk_re = re.compile(
-        r"Hunk\s+#(\d+)\s+succeeded\s+at\s+(\d+)\s+\(offset\s+([+-]?\d+)\s+lines?\)"
+
+def _analyze_cached(content: str, language: str, modified_lines: Set[int]) -> AnalysisResult:
+    """Memoized analyze_source; see _analysis_cache for the key semantics."""
+    key = (
+        hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest(),
+        language,
+        frozenset(modified_lines),
     )
-    # Regex: match 'Checking patch' file lines
-    checking_patch_re = re.compile(r"Checking patch (.+?)\.\.\.")
+    result = _analysis_cache.get(key)
+    if result is None:
+        # analyze() copies modified_lines before correcting it, so the
+        # caller set can be handed over without a defensive copy
+        result = analyze_source(content, language, modified_lines)
+        if len(_analysis_cache) >= _ANALYSIS_CACHE_LIMIT:
+            _analysis_cache.clear()
+        _analysis_cache[key] = result
+    return result
 
 
+
+# Fused patch-log pattern, compiled once at import: one engine pass per line
+# decides between 'Checking patch xxx...' (anchored at line start, like the
+# old match()) and hunk headers (matched anywhere, like the old search()).
+# MULTILINE lets finditer stream the raw log without a splitlines pass; the
+# leading [ \t]* stands in for the per-line strip the old loop performed.
+_PATCH_LOG_RE = re.compile(
+    r"^[ \t]*Checking patch (?P<file>.+?)\.\.\."
+    r"|Hunk\s+#(?P<hunk>\d+)\s+succeeded\s+at\s+(?P<line>\d+)\s+\(offset\s+(?P<off>[+-]?\d+)\s+lines?\)",
+    re.MULTILINE
+)
+
+
+def parse_patch_log(log_content: str) -> dict:
     result = {}
     current_file = None
 
-    for line in log_content.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-
-        # Check if line is "Checking patch xxx.py..." -> current file being processed
-        checking_match = checking_patch_re.match(line)
-        if checking_match:
-            current_file = checking_match.group(1)
+    # One finditer pass over the raw buffer: no splitlines list, no per-line
+    # strip copies; the regex engine skips non-matching text in C.
+    for m in _PATCH_LOG_RE.finditer(log_content):
+        # "Checking patch xxx.py..." -> current file being processed
+        if m.group("file") is not None:
+            current_file = m.group("file")
             if current_file not in result:
                 result[current_file] = {}
             continue
 
-        # Check if line is a hunk header -> extract hunk info
-        hunk_match = hunk_re.search(line)
-        if hunk_match and current_file:
-            hunk_num = int(hunk_match.group(1))
-            applied_line = int(hunk_match.group(2))
-            offset = int(hunk_match.group(3))
+        # Otherwise it is a hunk header -> extract hunk info
+        if current_file:
+            hunk_num = int(m.group("hunk"))
+            applied_line = int(m.group("line"))
+            offset = int(m.group("off"))
 
             hunk_info = {
                 "hunk": hunk_num,
@@ -71,42 +100,88 @@ def parse_patch_log(log_content: str) -> dict:
 
 
 # ---------- diff file parsing ----------
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def _diff_file_path(source_file: str, target_file: str) -> str:
+    """Abstract a file path from ---/+++ names, mirroring unidiff's rules."""
+    if source_file.startswith("a/") and target_file.startswith("b/"):
+        return source_file[2:]
+    if source_file.startswith("a/") and target_file == "/dev/null":
+        return source_file[2:]
+    if target_file.startswith("b/") and source_file == "/dev/null":
+        return target_file[2:]
+    return source_file
+
+
 def parse_modified_info(diff_text: str,offset_dict=None) -> Dict[str, Set[int]]:
     """
-    Parse unified diff using unidiff library.
+    Parse unified diff with a single streaming scan.
     Returns:
         modified_info: dict[str, set[int]]  # only added lines
+
+    Only file headers, hunk headers and the added-line counter are tracked,
+    so no per-line object graph is built for large patches. Hunk content is
+    consumed against the lengths declared in the @@ header, which keeps
+    content lines that merely look like diff headers from being mistaken
+    for real ones.
     """
-    patch = PatchSet(diff_text)
     modified_info: Dict[str, Set[int]] = {}
 
-    for patched_file in patch:
-        file_path = patched_file.path
+    source_file = None
+    current_added = None
+    file_offset = None
+    hunk_idx = 0
+    offset_num = 0
+    target_line = 0
+    src_remaining = tgt_remaining = 0
+
+    for line in diff_text.splitlines():
+        if src_remaining > 0 or tgt_remaining > 0:
+            # Inside a hunk: consume against the declared budgets
+            if line.startswith("+"):
+                current_added.add(target_line + offset_num)
+                target_line += 1
+                tgt_remaining -= 1
+            elif line.startswith("-"):
+                src_remaining -= 1
+            elif line.startswith("\\"):
+                pass  # "\ No newline at end of file"
+            else:
+                target_line += 1
+                src_remaining -= 1
+                tgt_remaining -= 1
+            continue
 
-        modified_info[file_path] = set()
+        if line.startswith("--- "):
+            source_file = line[4:].split("\t", 1)[0]
+            continue
 
-        file_offset = None
-        if offset_dict:
-            file_offset = offset_dict[file_path]
+        if line.startswith("+++ ") and source_file is not None:
+            target_file = line[4:].split("\t", 1)[0]
+            file_path = _diff_file_path(source_file, target_file)
+            source_file = None
 
-            
-        for idx, hunk in enumerate(patched_file):
-            offset_num = 0
-            if file_offset and str(idx+1) in file_offset:
-                applied_at_line = file_offset[str(idx+1)]['applied_at_line']
-                offset_num = applied_at_line - hunk.target_start
+            current_added = modified_info[file_path] = set()
+            file_offset = offset_dict[file_path] if offset_dict else None
+            hunk_idx = 0
+            continue
 
-            for line in hunk:
-                if line.is_added:
-                    # target_line_no is the line number of the added line
-                    modified_info[file_path].add(line.target_line_no+offset_num)
+        if current_added is not None:
+            hunk_match = _HUNK_HEADER_RE.match(line)
+            if hunk_match:
+                src_remaining = int(hunk_match.group(2)) if hunk_match.group(2) is not None else 1
+                target_line = int(hunk_match.group(3))
+                tgt_remaining = int(hunk_match.group(4)) if hunk_match.group(4) is not None else 1
+                hunk_idx += 1
 
-        # Skip if an empty file was added
-        if not modified_info[file_path]:
-            del modified_info[file_path]
-            continue
+                offset_num = 0
+                if file_offset and str(hunk_idx) in file_offset:
+                    applied_at_line = file_offset[str(hunk_idx)]['applied_at_line']
+                    offset_num = applied_at_line - target_line
 
-    return modified_info
+    # Skip files with no added lines (e.g. an empty file was added)
+    return {path: lines for path, lines in modified_info.items() if lines}
 
 
 
@@ -116,14 +191,24 @@ def fetch_file_from_container(container, path_in_container: str) -> str | None:
     Read file content from container using 'cat'.
     Returns None if file does not exist.
     """
-    exec_result = container.exec_run(
-        f"cat {path_in_container}",
+    # Stream the exec output into one buffer instead of letting the SDK
+    # accumulate the whole file and hand over a second copy; the low-level
+    # API is used because exec_run(stream=True) cannot report the exit code.
+    api = container.client.api
+    exec_id = api.exec_create(
+        container.id,
+        f"cat {shlex.quote(path_in_container)}",
         workdir=DOCKER_WORKDIR,
         user=DOCKER_USER
-    )
-    if exec_result.exit_code != 0:
+    )["Id"]
+
+    buf = bytearray()
+    for chunk in api.exec_start(exec_id, stream=True):
+        buf.extend(chunk)
+
+    if api.exec_inspect(exec_id).get("ExitCode") != 0:
         return None
-    return exec_result.output.decode("utf-8", "ignore")
+    return buf.decode("utf-8", "ignore")
 
 
 def dump_modified_files(container, modified_files: list[str], save_dir: Path):
@@ -131,25 +216,58 @@ def dump_modified_files(container, modified_files: list[str], save_dir: Path):
     Save full contents of modified files into save_dir/modified_files/
     Returns a list of tuples: (relative_path, content or None)
     """
+    def _fetch(file_path):
+        return fetch_file_from_container(container, f"{DOCKER_WORKDIR}/{file_path}")
+
+    # Fetch concurrently: each read is a docker exec round-trip, so the pool
+    # hides the per-file RTT. A single file stays serial; writes below run
+    # serially and in input order either way.
+    if len(modified_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(modified_files))) as pool:
+            contents = list(pool.map(_fetch, modified_files))
+    else:
+        contents = [_fetch(file_path) for file_path in modified_files]
+
     dumped = []
-    for file_path in modified_files:
+    out_dir = save_dir / "modified_files"
+    out_dir.mkdir(parents=True, exist_ok=True)
 
-        inner_path = f"{DOCKER_WORKDIR}/{file_path}"
-        content = fetch_file_from_container(container, inner_path)
-        
+    for file_path, content in zip(modified_files, contents):
         if content is None:
             continue
 
         dumped.append((file_path, content))
         save_name = file_path.replace("/", "__") + ".after"
-        output_path = save_dir / "modified_files" / save_name
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = out_dir / save_name
+        hash_path = out_dir / (save_name + ".hash")
+
+        # Content-hash short-circuit: re-runs over the same instance dump
+        # identical contents, so skip the write when the sidecar digest of
+        # the existing file already matches.
+        new_hash = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+        if output_path.exists() and hash_path.exists() and hash_path.read_text() == new_hash:
+            continue
+
         output_path.write_text(content, encoding="utf-8")
+        hash_path.write_text(new_hash)
 
     return dumped
 
 
 # ---------- automatic slicing ----------
+def _invert_def_use(mapping):
+    """Invert a line -> vars map into var -> tuple of lines."""
+    by_var = defaultdict(list)
+    for ln, names in mapping.items():
+        for name in names:
+            by_var[name].append(ln)
+    # Freeze the neighbor lists into tuples: contiguous, cheap to iterate in
+    # the hop loop, and immutable so cached/shared indexes cannot be mutated.
+    # (Lines are unique per variable because each source line contributes a
+    # variable name at most once.)
+    return {name: tuple(lines) for name, lines in by_var.items()}
+
+
 def slice_engine_k(
     modified_lines,
     defs,
@@ -175,53 +293,147 @@ def slice_engine_k(
     else:
         target_scopes = None
 
-    affected = set(modified_lines)
-    frontier = set(modified_lines)
+    # Flat frontier arena: every discovered line is appended to one list and
+    # each hop walks only the [depth_start, depth_end) span appended by the
+    # previous hop, so no per-hop frontier sets are allocated. The affected
+    # bitmap doubles as the visited filter: one byte per line number makes
+    # membership a subscript instead of a set hash.
+    max_line = max(
+        max(defs, default=0),
+        max(uses, default=0),
+        max(modified_lines, default=0),
+    ) + 1
+    affected = bytearray(max_line)
+    for ln in modified_lines:
+        affected[ln] = 1
+    frontier_arr = list(modified_lines)
+    depth_start, depth_end = 0, len(frontier_arr)
+
+    # Invert the def/use maps once: var -> lines. A hop then only visits the
+    # lines that actually touch the frontier's variables instead of scanning
+    # every line in the file per hop.
+    defs_by_var = _invert_def_use(defs)
+    uses_by_var = _invert_def_use(uses)
+
+    # Variables already expanded in an earlier hop add nothing when seen
+    # again: their neighbor lines are either affected already or blocked by
+    # the (fixed) scope filter. Only the per-hop delta drives expansion.
+    vars_seen = set()
 
     for _ in range(k):
-        next_frontier = set()
 
         # -----------------------------
         # 1. Collect def/use info for frontier lines
         # -----------------------------
+        hop_vars = set()
         if direction == "forward":
-            vars_of_interest = set()
-            for ln in frontier:
-                vars_of_interest |= defs.get(ln, set())
+            for i in range(depth_start, depth_end):
+                hop_vars |= defs.get(frontier_arr[i], set())
+            neighbor_index = uses_by_var
         else:
-            vars_of_interest = set()
-            for ln in frontier:
-                vars_of_interest |= uses.get(ln, set())
+            for i in range(depth_start, depth_end):
+                hop_vars |= uses.get(frontier_arr[i], set())
+            neighbor_index = defs_by_var
+
+        vars_of_interest = hop_vars - vars_seen
+        vars_seen |= vars_of_interest
 
         # -----------------------------
-        # 2. Iterate over all lines to find which new lines are affected by propagation
+        # 2. Visit only the neighbor lines of those variables
         # -----------------------------
-        all_lines = set(defs.keys()) | set(uses.keys())
+        for var in vars_of_interest:
+            for ln in neighbor_index.get(var, ()):
+                if affected[ln]:
+                    continue
 
-        for ln in all_lines:
-            if ln in affected:
-                continue
+                if limit_scope and line_scope.get(ln) not in target_scopes:
+                    continue
 
-            if limit_scope and line_scope.get(ln) not in target_scopes:
-                continue
+                affected[ln] = 1
+                frontier_arr.append(ln)
 
-            if direction == "forward":
-                used_vars = uses.get(ln, set())
-                if used_vars & vars_of_interest:
-                    affected.add(ln)
-                    next_frontier.add(ln)
+        depth_start, depth_end = depth_end, len(frontier_arr)
+        if depth_start == depth_end:
+            break
 
-            else:  # backward
-                defined_vars = defs.get(ln, set())
-                if defined_vars & vars_of_interest:
-                    affected.add(ln)
-                    next_frontier.add(ln)
+    return {ln for ln in range(max_line) if affected[ln]}
 
-        frontier = next_frontier
-        if not frontier:
-            break
 
-    return affected
+def slice_engine_k_bidir(
+    modified_lines,
+    defs,
+    uses,
+    k,
+    line_scope,
+    limit_scope=False,
+    defs_by_var=None,
+    uses_by_var=None
+):
+    """
+        Bidirectional slicing engine: union of the forward and backward
+        k-hop slices in a single call.
+
+            Equivalent to slice_engine_k(..., "forward") unioned with
+            slice_engine_k(..., "backward"), but the def/use inversion and
+            the target scope set are built once and shared by both
+            directions, halving the per-call setup.
+    """
+    if limit_scope:
+        target_scopes = { line_scope[m] for m in modified_lines }
+    else:
+        target_scopes = None
+
+    # Callers running several passes over the same maps can pass the
+    # inverted indexes in to share one inversion
+    if defs_by_var is None:
+        defs_by_var = _invert_def_use(defs)
+    if uses_by_var is None:
+        uses_by_var = _invert_def_use(uses)
+
+    max_line = max(
+        max(defs, default=0),
+        max(uses, default=0),
+        max(modified_lines, default=0),
+    ) + 1
+
+    def expand(frontier_vars, neighbor_index):
+        # Same flat frontier arena and per-hop variable delta as
+        # slice_engine_k, with the same one-byte-per-line affected bitmap
+        affected = bytearray(max_line)
+        for ln in modified_lines:
+            affected[ln] = 1
+        frontier_arr = list(modified_lines)
+        depth_start, depth_end = 0, len(frontier_arr)
+        vars_seen = set()
+        for _ in range(k):
+            hop_vars = set()
+            for i in range(depth_start, depth_end):
+                hop_vars |= frontier_vars.get(frontier_arr[i], set())
+
+            vars_of_interest = hop_vars - vars_seen
+            vars_seen |= vars_of_interest
+
+            for var in vars_of_interest:
+                for ln in neighbor_index.get(var, ()):
+                    if affected[ln]:
+                        continue
+                    if limit_scope and line_scope.get(ln) not in target_scopes:
+                        continue
+                    affected[ln] = 1
+                    frontier_arr.append(ln)
+
+            depth_start, depth_end = depth_end, len(frontier_arr)
+            if depth_start == depth_end:
+                break
+        return affected
+
+    # forward: def -> use; backward: use -> def; OR the bitmaps, then
+    # materialize line numbers once
+    merged = expand(defs, uses_by_var)
+    for ln, hit in enumerate(expand(uses, defs_by_var)):
+        if hit:
+            merged[ln] = 1
+    return {ln for ln in range(max_line) if merged[ln]}
 
 
 def compute_patch_slice_k(
@@ -252,78 +464,104 @@ def compute_patch_slice_k(
         line2scope = analysis_result.line_to_scope
         defs = analysis_result.defs
         uses = analysis_result.uses
-        nodes_by_lineno = analysis_result.nodes_by_lineno
     else:
         # Fallback: analyze as Python (for backward compatibility)
         from swebench.harness.code_analysis import PythonAnalyzer
         py_analyzer = PythonAnalyzer()
-        result = py_analyzer.analyze(src, modified_lines.copy())
+        result = _analyze_cached(src, "python", modified_lines)
         line2scope = result.line_to_scope
         defs = result.defs
         uses = result.uses
-        nodes_by_lineno = result.nodes_by_lineno
         analyzer = py_analyzer
 
-    # 3. Forward slice (full scope)
-    fwd_full = slice_engine_k(
-        modified_lines,
-        defs,
-        uses,
-        k=k,
-        line_scope=line2scope,
-        direction="forward",
-        limit_scope=False
-    )
+    # Nothing to slice from: both slices are empty, skip the engine entirely
+    if not modified_lines:
+        return set(), set()
+
+    # Both bidirectional passes share a single inversion of the def/use maps
+    defs_by_var = _invert_def_use(defs)
+    uses_by_var = _invert_def_use(uses)
 
-    # 4. Backward slice (full scope)
-    bwd_full = slice_engine_k(
+    # 3. Forward + backward slice (full scope), one bidirectional pass
+    full_slice = slice_engine_k_bidir(
         modified_lines,
         defs,
         uses,
         k=k,
         line_scope=line2scope,
-        direction="backward",
-        limit_scope=False
+        limit_scope=False,
+        defs_by_var=defs_by_var,
+        uses_by_var=uses_by_var
     )
 
-    # Filter global modified lines
+    # Filter global modified lines (nodes resolved on demand from src's parse tree)
     if analyzer:
         filtered_modified = analyzer.filtered_global_modified(
-            line2scope, nodes_by_lineno, modified_lines
+            line2scope, {}, modified_lines, src=src
         )
     else:
         # No filtering if no analyzer
         filtered_modified = modified_lines
 
-    # Scoped slicing with filtered modified lines
-    fwd = slice_engine_k(
-        filtered_modified,
-        defs,
-        uses,
-        k=5,
-        line_scope=line2scope,
-        direction="forward",
-        limit_scope=limit_scope
-    )
-    bwd = slice_engine_k(
-        filtered_modified,
-        defs,
-        uses,
-        k=5,
-        line_scope=line2scope,
-        direction="backward",
-        limit_scope=limit_scope
-    )
+    # 4. Scoped slicing with filtered modified lines; when filtering removed
+    # every modified line the scoped slice is empty without running the engine
+    if filtered_modified:
+        # Intern scope names to small ints first: the scoped engine hashes a
+        # scope per visited neighbor, and an int membership test beats
+        # rehashing long qualified names like 'Class.method' on every check.
+        # Lines absent from line2scope stay absent, so the engine's KeyError
+        # on an unscoped modified line is unchanged.
+        scope_ids: Dict[Any, int] = {}
+        line_scope_id = {
+            ln: scope_ids.setdefault(scope, len(scope_ids))
+            for ln, scope in line2scope.items()
+        }
+
+        scoped_slice = slice_engine_k_bidir(
+            filtered_modified,
+            defs,
+            uses,
+            k=5,
+            line_scope=line_scope_id,
+            limit_scope=limit_scope,
+            defs_by_var=defs_by_var,
+            uses_by_var=uses_by_var
+        )
+    else:
+        scoped_slice = set()
 
 
     # print("bwd:",sorted(list(bwd)))
 
     # 5. Combine results
-    return fwd | bwd, fwd_full | bwd_full
+    return scoped_slice, full_slice
 
 
 
 
+# Extension -> (language, analyzer) resolution, shared across calls and
+# files: every file with the same suffix resolves identically, so the
+# registry dispatch runs once per extension instead of once per file.
+# Analyzer instances are already shared (they keep per-thread parsers).
+_ext_cache: Dict[str, Tuple[Optional[str], Optional[Any]]] = {}
+
+
+def _resolve_analyzer(file_path: str) -> Tuple[Optional[str], Optional[Any]]:
+    """Memoized detect_language_from_path + get_analyzer, keyed on suffix."""
+    from swebench.harness.code_analysis import get_analyzer
+
+    ext = Path(file_path).suffix
+    entry = _ext_cache.get(ext)
+    if entry is None:
+        language = detect_language_from_path(file_path)
+        analyzer = None
+        if language is not None and is_language_supported(language):
+            analyzer = get_analyzer(language)
+        entry = (language, analyzer)
+        _ext_cache[ext] = entry
+    return entry
+
+
 def compute_must_coverage(container, patch, save_dir, logger, patch_log):
     """
     Compute must-coverage information for a patch.
@@ -340,8 +578,6 @@ def compute_must_coverage(container, patch, save_dir, logger, patch_log):
     Returns:
         Dictionary mapping file paths to coverage information
     """
-    from swebench.harness.code_analysis import get_analyzer
-
     offset_dict = parse_patch_log(patch_log)
     modified_info = parse_modified_info(patch, offset_dict)
     modified_info: Dict[str, Set[int]]
@@ -349,27 +585,24 @@ def compute_must_coverage(container, patch, save_dir, logger, patch_log):
     must_coverage = {}
     dumps = dump_modified_files(container, list(modified_info.keys()), save_dir)
 
-    for file_path, content in dumps:
-        # Detect language from file extension
-        language = detect_language_from_path(file_path)
+    def _analyze_file(file_path, content):
+        # Detect language from file extension (memoized per suffix)
+        language, analyzer = _resolve_analyzer(file_path)
 
         if language is None:
             logger.warning(f"Unsupported file type, skipping: {file_path}")
-            continue
+            return None
 
-        if not is_language_supported(language):
-            logger.warning(f"Language '{language}' not supported, skipping: {file_path}")
-            continue
-
-        try:
-            # Get the analyzer for this language
-            analyzer = get_analyzer(language)
-            if analyzer is None:
+        if analyzer is None:
+            if not is_language_supported(language):
+                logger.warning(f"Language '{language}' not supported, skipping: {file_path}")
+            else:
                 logger.warning(f"No analyzer for language '{language}', skipping: {file_path}")
-                continue
+            return None
 
+        try:
             # Analyze source code
-            analysis_result = analyze_source(content, language, modified_info[file_path].copy())
+            analysis_result = _analyze_cached(content, language, modified_info[file_path])
 
             # Get executable lines and corrected modified lines
             executable_lines = analysis_result.executable_lines
@@ -384,21 +617,36 @@ def compute_must_coverage(container, patch, save_dir, logger, patch_log):
                 analyzer=analyzer
             )
 
-            exe_slice_lines = slice_region & executable_lines
-            exe_slice_lines_scope = slice_region_scope & executable_lines
-            exe_modified_lines = modified_lines & executable_lines
+            # One sort of the executable lines feeds all three outputs;
+            # membership scans against the slice sets then yield each list
+            # already ordered, instead of three intersection sets each
+            # sorted separately.
+            exe_sorted = sorted(executable_lines)
 
-            must_coverage[file_path] = {
-                "exe_slice_lines_scope": sorted(exe_slice_lines_scope),
-                "exe_slice_lines": sorted(exe_slice_lines),
-                "exe_modified_lines": sorted(exe_modified_lines),
+            return {
+                "exe_slice_lines_scope": [ln for ln in exe_sorted if ln in slice_region_scope],
+                "exe_slice_lines": [ln for ln in exe_sorted if ln in slice_region],
+                "exe_modified_lines": [ln for ln in exe_sorted if ln in modified_lines],
                 "content": content,
                 "language": language,
             }
 
         except Exception as e:
             logger.error(f"Failed to analyze {file_path} ({language}): {e}")
-            continue
+            return None
+
+    # Analyze files concurrently: tree-sitter parses release the GIL and the
+    # analyzers keep per-thread parsers, so multi-file patches overlap. A
+    # single file stays serial, and results land in dump order regardless.
+    if len(dumps) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(dumps))) as pool:
+            entries = list(pool.map(lambda item: _analyze_file(*item), dumps))
+    else:
+        entries = [_analyze_file(file_path, content) for file_path, content in dumps]
+
+    for (file_path, _), entry in zip(dumps, entries):
+        if entry is not None:
+            must_coverage[file_path] = entry
 
     return must_coverage
 
@@ -491,7 +739,6 @@ if __name__ == "__main__":
     file_key = file_path.replace("__", "/")
     content = modified_file.read_text()
     modified_info = parse_modified_info(patch, offset_dict)
-    modified_info_copy = copy.deepcopy(modified_info)
 
     # Detect language and get analyzer
     language = detect_language_from_path(file_key)
@@ -499,7 +746,7 @@ if __name__ == "__main__":
 
     if language:
         analyzer = get_analyzer(language)
-        analysis_result = analyze_source(content, language, modified_info[file_key].copy())
+        analysis_result = analyze_source(content, language, modified_info[file_key])
 
         executable_lines = analysis_result.executable_lines
         modified_lines = analysis_result.modified_lines